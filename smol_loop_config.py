@@ -20,7 +20,7 @@ DEFAULT_ENDPOINTS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SmolLoopConfig:
     """Configuration for smol_loop execution."""
 
@@ -36,12 +36,13 @@ class SmolLoopConfig:
 
     def __post_init__(self):
         """Post-initialization processing."""
+        # Frozen, so defaults are filled in through object.__setattr__
         if not self.model:
-            self.model = DEFAULT_MODEL[self.provider]
+            object.__setattr__(self, "model", DEFAULT_MODEL[self.provider])
         if isinstance(self.output_dir, str):
-            self.output_dir = Path(self.output_dir)
+            object.__setattr__(self, "output_dir", Path(self.output_dir))
         if not self.endpoint_url:
-            self.endpoint_url = DEFAULT_ENDPOINTS[self.provider]
+            object.__setattr__(self, "endpoint_url", DEFAULT_ENDPOINTS[self.provider])
 
     @property
     def provider_name(self) -> str:
@@ -49,7 +50,7 @@ class SmolLoopConfig:
         return self.provider.name.lower()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImprovementStrategy:
     """Strategy for improving code generation."""
 
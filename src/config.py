@@ -1,6 +1,7 @@
 """Configuration module."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from pydantic import BaseSettings, Field
@@ -53,6 +54,14 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get cached application settings.
+    
+    Call get_settings.cache_clear() after changing the environment.
+    """
+    return Settings()
+
 @dataclass
 class GPUConfig:
     """GPU configuration."""
@@ -108,7 +117,7 @@ class Config:
     
     def __init__(self, settings: Optional[Settings] = None):
         """Initialize configuration."""
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         
         # Initialize components
         self.gpu = GPUConfig(
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
-from typing import Optional
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from src.api.main import app as api_app
@@ -17,6 +20,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Application records are queued and written by a background listener
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_log_listener: Optional[QueueListener] = None
+
 # Create main application
 app = FastAPI(
     title="GPU Analytics Platform",
@@ -38,9 +46,57 @@ cache = AnalyticsCache(
     )
 )
 
+@lru_cache(maxsize=1)
+def get_gpu_device_info() -> Dict[str, Any]:
+    """Get static GPU device information (cached for the process lifetime)."""
+    import torch
+    available = torch.cuda.is_available()
+    return {
+        "available": available,
+        "device_count": torch.cuda.device_count() if available else 0
+    }
+
+def get_gpu_stats() -> Dict[str, Any]:
+    """Get GPU statistics, re-querying only the memory counters."""
+    import torch
+    info = get_gpu_device_info()
+    available = info["available"]
+    return {
+        **info,
+        "memory_allocated": torch.cuda.memory_allocated() if available else 0,
+        "memory_reserved": torch.cuda.memory_reserved() if available else 0
+    }
+
+def start_log_listener():
+    """Route application logging through the queue to the root handlers."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    _log_listener = QueueListener(
+        _log_queue,
+        *logging.getLogger().handlers,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    logger.addHandler(_queue_handler)
+    logger.propagate = False
+
+def stop_log_listener():
+    """Flush queued records and restore direct logging."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    logger.removeHandler(_queue_handler)
+    logger.propagate = True
+    _log_listener.stop()
+    _log_listener = None
+
 @app.on_event("startup")
 async def startup():
     """Initialize application on startup."""
+    start_log_listener()
     logger.info("Starting GPU Analytics Platform")
     
     try:
@@ -70,7 +126,7 @@ async def startup():
         logger.info("Error recovery strategies initialized")
         
     except Exception as e:
-        logger.error(f"Error during startup: {str(e)}")
+        logger.error("Error during startup: %s", e)
         raise
 
 @app.on_event("shutdown")
@@ -84,23 +140,23 @@ async def shutdown():
         logger.info("Cache cleanup task stopped")
         
         # Log final statistics
-        cache_stats = cache.get_stats()
-        logger.info(f"Final cache statistics: {cache_stats}")
-        
-        error_stats = error_handler.get_error_stats()
-        logger.info(f"Final error statistics: {error_stats}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Final cache statistics: %s", cache.get_stats())
+            logger.info("Final error statistics: %s", error_handler.get_error_stats())
         
     except Exception as e:
-        logger.error(f"Error during shutdown: {str(e)}")
+        logger.error("Error during shutdown: %s", e)
+    
+    finally:
+        stop_log_listener()
 
 @app.get("/")
 async def root():
     """Root endpoint."""
-    import torch
     return {
         "name": "GPU Analytics Platform",
         "version": "1.0.0",
-        "gpu_available": torch.cuda.is_available(),
+        "gpu_available": get_gpu_device_info()["available"],
         "endpoints": [
             {"path": "/api", "description": "Analytics API"},
             {"path": "/docs", "description": "API documentation"},
@@ -115,15 +171,10 @@ async def get_stats():
         return {
             "cache": cache.get_stats(),
             "errors": error_handler.get_error_stats(),
-            "gpu": {
-                "available": torch.cuda.is_available(),
-                "device_count": torch.cuda.device_count() if torch.cuda.is_available() else 0,
-                "memory_allocated": torch.cuda.memory_allocated() if torch.cuda.is_available() else 0,
-                "memory_reserved": torch.cuda.memory_reserved() if torch.cuda.is_available() else 0
-            }
+            "gpu": get_gpu_stats()
         }
     except Exception as e:
-        logger.error(f"Error getting stats: {str(e)}")
+        logger.error("Error getting stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Error retrieving system statistics"
@@ -145,7 +196,7 @@ def run_server(
             workers=workers or (1 if reload else None)
         )
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -110,24 +110,29 @@ QUALITY = {
     'slow': '🐌',
 }
 
+# Category name -> emoji dictionary
+_CATEGORIES = {
+    'test': TEST_STATUS,
+    'code': CODE_GEN,
+    'process': PROCESSING,
+    'ai': AI_ML,
+    'dev': DEV,
+    'file': FILES,
+    'system': SYSTEM,
+    'progress': PROGRESS,
+    'quality': QUALITY,
+}
+
+# Flattened (category, key) -> emoji lookup
+_FLAT = {
+    (category, key): emoji
+    for category, emojis in _CATEGORIES.items()
+    for key, emoji in emojis.items()
+}
+
 def get_emoji(category: str, key: str, default: str = '❓') -> str:
     """Get emoji by category and key with fallback."""
-    categories = {
-        'test': TEST_STATUS,
-        'code': CODE_GEN,
-        'process': PROCESSING,
-        'ai': AI_ML,
-        'dev': DEV,
-        'file': FILES,
-        'system': SYSTEM,
-        'progress': PROGRESS,
-        'quality': QUALITY,
-    }
-    
-    if category not in categories:
-        return default
-        
-    return categories[category].get(key, default)
+    return _FLAT.get((category, key), default)
 
 def format_with_emoji(text: str, category: str, key: str) -> str:
     """Format text with emoji prefix."""
@@ -0,0 +1,121 @@
+import pytest_asyncio
+from sqlalchemy import select
+
+from recipe_db import Ingredient, RecipeDatabase
+from recipe_validation import IngredientModel, RecipeModel
+
+def make_recipe(index: int, tags: list) -> RecipeModel:
+    return RecipeModel(
+        id=f"r{index}",
+        name=f"Pasta {index}",
+        description="A tasty pasta dish for testing",
+        ingredients=[{"name": "flour", "amount": 100, "unit": "g"}],
+        instructions=["Mix", "Cook"],
+        category="main_course",
+        difficulty="easy",
+        prep_time=10,
+        cook_time=20,
+        servings=2,
+        tags=tags
+    )
+
+@pytest_asyncio.fixture
+async def db():
+    database = RecipeDatabase("sqlite://")
+    for i in range(5):
+        await database.add_recipe(make_recipe(i, ["italian", "quick", "vegan"]))
+    yield database
+    await database.engine.dispose()
+
+async def test_multi_tag_filter_returns_each_recipe_once(db):
+    recipes, total = await db.search_recipes(
+        "", per_page=10, filters={"tags": ["italian", "quick", "vegan"]}
+    )
+
+    assert [recipe.id for recipe in recipes] == ["r0", "r1", "r2", "r3", "r4"]
+    assert total == 5
+
+async def test_multi_tag_filter_paginates_by_recipe(db):
+    recipes, total = await db.search_recipes(
+        "pasta", page=2, per_page=2, filters={"tags": ["italian", "quick"]}
+    )
+
+    assert [recipe.id for recipe in recipes] == ["r2", "r3"]
+    assert total == 5
+
+def embedding_for(index: int) -> list:
+    return [float(index), 1.0, 0.0, 0.0]
+
+async def test_embedding_matrix_grows_past_initial_capacity(db):
+    ids, matrix = await db.get_embedding_matrix()
+    assert len(ids) == 0
+
+    for i in range(5, 25):
+        await db.add_recipe(make_recipe(i, []), embedding=embedding_for(i))
+
+    ids, matrix = await db.get_embedding_matrix()
+    assert list(ids) == [f"r{i}" for i in range(5, 25)]
+    assert matrix.shape == (20, 4)
+    assert matrix[:, 0].tolist() == [float(i) for i in range(5, 25)]
+    assert not matrix.flags.writeable
+
+async def test_delete_drops_cached_embedding(db):
+    await db.add_recipe(make_recipe(5, []), embedding=embedding_for(5))
+    await db.add_recipe(make_recipe(6, []), embedding=embedding_for(6))
+    await db.get_embedding_matrix()
+    await db.get_category_embeddings("main_course")
+
+    await db.delete_recipe("r5")
+
+    ids, matrix = await db.get_embedding_matrix()
+    assert list(ids) == ["r6"]
+    assert matrix[:, 0].tolist() == [6.0]
+    bucket_ids, _ = await db.get_category_embeddings("main_course")
+    assert list(bucket_ids) == ["r6"]
+
+async def test_category_change_moves_embedding_between_buckets(db):
+    recipe = make_recipe(5, [])
+    await db.add_recipe(recipe, embedding=embedding_for(5))
+    assert list((await db.get_category_embeddings("main_course"))[0]) == ["r5"]
+    assert len((await db.get_category_embeddings("breakfast"))[0]) == 0
+
+    category = type(recipe.category)("breakfast")
+    await db.update_recipe("r5", recipe.model_copy(update={"category": category}))
+
+    assert len((await db.get_category_embeddings("main_course"))[0]) == 0
+    assert list((await db.get_category_embeddings("breakfast"))[0]) == ["r5"]
+
+async def test_category_bucket_includes_later_insert(db):
+    await db.add_recipe(make_recipe(5, []), embedding=embedding_for(5))
+    assert list((await db.get_category_embeddings("main_course"))[0]) == ["r5"]
+
+    await db.add_recipe(make_recipe(6, []), embedding=embedding_for(6))
+
+    ids, matrix = await db.get_category_embeddings("main_course")
+    assert list(ids) == ["r5", "r6"]
+    assert matrix[:, 0].tolist() == [5.0, 6.0]
+
+async def test_update_diffs_ingredients_by_name(db):
+    async with db.Session() as session:
+        flour_id = await session.scalar(select(Ingredient.id).where(Ingredient.recipe_id == "r0"))
+
+    recipe = await db.get_recipe("r0")
+    await db.update_recipe("r0", recipe.model_copy(update={"ingredients": [
+        IngredientModel(name="flour", amount=250, unit="g"),
+        IngredientModel(name="sugar", amount=50, unit="g"),
+    ]}))
+
+    updated = await db.get_recipe("r0")
+    assert [(ing.name, ing.amount) for ing in updated.ingredients] == [("flour", 250), ("sugar", 50)]
+    async with db.Session() as session:
+        rows = (await session.scalars(select(Ingredient).where(Ingredient.recipe_id == "r0"))).all()
+    assert {row.name: row.id for row in rows}["flour"] == flour_id
+
+    await db.update_recipe("r0", updated.model_copy(update={"ingredients": [
+        IngredientModel(name="sugar", amount=50, unit="g"),
+    ]}))
+
+    assert [ing.name for ing in (await db.get_recipe("r0")).ingredients] == ["sugar"]
+    async with db.Session() as session:
+        names = (await session.scalars(select(Ingredient.name).where(Ingredient.recipe_id.is_(None)))).all()
+    assert names == []
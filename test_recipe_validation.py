@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from recipe_exceptions import RecipeValidationError
+from recipe_validation import (
+    RecipeCategory, RecipeModel, decode_recipe_json, validate_recipe_batch,
+    validate_recipe_data, validate_search_query
+)
+
+VALID_RECIPE = {
+    "name": "Pasta",
+    "description": "A tasty pasta dish for testing",
+    "ingredients": [{"name": "flour", "amount": 100, "unit": "g"}],
+    "instructions": ["Mix", "Cook"],
+    "category": "main_course",
+    "difficulty": "easy",
+    "prep_time": 10,
+    "cook_time": 20,
+    "servings": 2
+}
+
+def test_construct_trusted_matches_validated_model():
+    trusted = validate_recipe_data(VALID_RECIPE, trusted=True)
+    validated = validate_recipe_data(VALID_RECIPE)
+
+    assert trusted.category is RecipeCategory.MAIN_COURSE
+    assert trusted.ingredients[0].name == "flour"
+    assert trusted.model_dump(exclude={"created_at", "updated_at"}) == (
+        validated.model_dump(exclude={"created_at", "updated_at"})
+    )
+
+@pytest.mark.parametrize("page", ["2", 2])
+def test_search_query_accepts_integer_pages(page):
+    query = validate_search_query({"query": " pasta ", "page": page, "per_page": "5"})
+    assert query == {"query": "pasta", "page": 2, "per_page": 5, "filters": {}}
+
+@pytest.mark.parametrize("page", [2.5, 2.0, " 3", "3 ", "+3", "0", 0, -1, "²", None])
+def test_search_query_rejects_non_integer_pages(page):
+    with pytest.raises(RecipeValidationError, match="positive integers"):
+        validate_search_query({"query": "pasta", "page": page, "per_page": 10})
+
+def test_decode_recipe_json_wraps_validation_errors():
+    with pytest.raises(RecipeValidationError, match="servings") as exc_info:
+        decode_recipe_json(json.dumps({**VALID_RECIPE, "servings": 0}))
+    assert isinstance(exc_info.value.__cause__, ValidationError)
+
+def test_decode_recipe_json_wraps_malformed_json():
+    with pytest.raises(RecipeValidationError) as exc_info:
+        decode_recipe_json('{"name": ')
+    assert isinstance(exc_info.value.__cause__, ValidationError)
+
+@pytest.mark.parametrize("encode", [lambda recipes: recipes, json.dumps])
+def test_validate_recipe_batch(encode):
+    recipes = validate_recipe_batch(encode([VALID_RECIPE, {**VALID_RECIPE, "name": "Soup"}]))
+    assert [recipe.name for recipe in recipes] == ["Pasta", "Soup"]
+    assert all(isinstance(recipe, RecipeModel) for recipe in recipes)
+
+@pytest.mark.parametrize("encode", [lambda recipes: recipes, json.dumps])
+def test_validate_recipe_batch_reports_failing_index(encode):
+    with pytest.raises(RecipeValidationError, match=r"1\.prep_time") as exc_info:
+        validate_recipe_batch(encode([VALID_RECIPE, {**VALID_RECIPE, "prep_time": -1}]))
+    assert isinstance(exc_info.value.__cause__, ValidationError)
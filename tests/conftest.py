@@ -1,9 +1,33 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 from src.api.main import app, DataPoint, AnalyticsRequest
 
+@pytest.fixture(scope="session")
+def assert_msg_in():
+    """Provide a check that needle appears in any message of container."""
+    def check(container, needle):
+        assert needle in "\n".join(container), f"{needle!r} not in {container!r}"
+    return check
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the test session.
+
+    Overriding event_loop is the pytest-asyncio 0.21 mechanism, hence the pin in requirements.txt.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="session")
+def rng():
+    """Share one seeded random generator across the test session."""
+    return np.random.default_rng(42)
+
 @pytest.fixture
 def client():
     """Create a test client."""
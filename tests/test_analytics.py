@@ -120,7 +120,6 @@ def test_malformed_data(client):
     )
     assert response.status_code == 422  # Pydantic validation error
 
-@pytest.mark.asyncio
 async def test_concurrent_requests(client, sample_data):
     """Test handling of concurrent analytics requests."""
     import asyncio
@@ -110,7 +110,6 @@ def test_malformed_data():
     )
     assert response.status_code == 422  # Pydantic validation error
 
-@pytest.mark.asyncio
 async def test_concurrent_requests():
     """Test handling of concurrent analytics requests."""
     import asyncio
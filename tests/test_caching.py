@@ -52,7 +52,6 @@ def test_cache_entry():
     assert entry.computation_time == 0.1
     assert entry.size_bytes == 100
 
-@pytest.mark.asyncio
 async def test_cache_basic_operations(cache):
     """Test basic cache operations."""
     # Set value
@@ -73,7 +72,6 @@ async def test_cache_basic_operations(cache):
     await cache.delete("key1")
     assert len(cache.cache) == 0
 
-@pytest.mark.asyncio
 async def test_cache_expiration(cache):
     """Test cache entry expiration."""
     await cache.set("key", "value", ttl=0.1)
@@ -89,7 +87,6 @@ async def test_cache_expiration(cache):
     value = await cache.get("key")
     assert value is None
 
-@pytest.mark.asyncio
 async def test_cache_eviction(cache):
     """Test cache eviction."""
     # Fill cache
@@ -100,7 +97,6 @@ async def test_cache_eviction(cache):
     assert len(cache.cache) == cache.config.max_size
     assert cache.get_stats()["evictions"] > 0
 
-@pytest.mark.asyncio
 async def test_cache_cleanup(cache):
     """Test cache cleanup."""
     # Add entries
@@ -119,7 +115,6 @@ async def test_cache_cleanup(cache):
     # Stop cleanup
     cache.stop_cleanup()
 
-@pytest.mark.asyncio
 async def test_cache_compression(cache):
     """Test value compression."""
     # Create large value
@@ -132,7 +127,6 @@ async def test_cache_compression(cache):
     value = await cache.get("key")
     assert value == large_value
 
-@pytest.mark.asyncio
 async def test_cache_with_numpy_arrays(cache):
     """Test caching numpy arrays."""
     array = np.random.randn(10, 10)
@@ -144,7 +138,6 @@ async def test_cache_with_numpy_arrays(cache):
     cached_array = await cache.get("array")
     assert np.array_equal(cached_array, array)
 
-@pytest.mark.asyncio
 async def test_cache_with_torch_tensors(cache):
     """Test caching PyTorch tensors."""
     tensor = torch.randn(10, 10)
@@ -156,7 +149,6 @@ async def test_cache_with_torch_tensors(cache):
     cached_tensor = await cache.get("tensor")
     assert torch.equal(cached_tensor, tensor)
 
-@pytest.mark.asyncio
 async def test_cached_decorator():
     """Test cached decorator."""
     call_count = 0
@@ -182,7 +174,6 @@ async def test_cached_decorator():
     assert result3 == 12
     assert call_count == 2
 
-@pytest.mark.asyncio
 async def test_cache_stats(cache):
     """Test cache statistics."""
     # Add some entries
@@ -201,7 +192,6 @@ async def test_cache_stats(cache):
     assert stats["size"] == 2
     assert stats["hit_ratio"] == 2/3
 
-@pytest.mark.asyncio
 async def test_custom_key_generator():
     """Test cached decorator with custom key generator."""
     def key_generator(*args, **kwargs):
@@ -216,7 +206,6 @@ async def test_custom_key_generator():
     assert result == 10
     assert "custom_key_5" in test_func.cache.cache
 
-@pytest.mark.asyncio
 async def test_concurrent_access(cache):
     """Test concurrent cache access."""
     async def access_cache(key, value):
@@ -2,8 +2,11 @@
 
 import pytest
 import asyncio
+import torch
 from src.lib.code_execution import CodeExecutor, execute_code_async
 
+requires_cuda = pytest.mark.skipif(not torch.cuda.is_available(), reason="no CUDA")
+
 @pytest.fixture
 def executor():
     """Create code executor instance."""
@@ -50,7 +53,6 @@ def test_calculate_complexity(executor):
     """
     assert executor.calculate_complexity(code) > 0.5
 
-@pytest.mark.asyncio
 async def test_basic_execution(executor):
     """Test basic code execution."""
     code = """
@@ -63,7 +65,6 @@ async def test_basic_execution(executor):
     assert result.error is None
     assert result.execution_time > 0
 
-@pytest.mark.asyncio
 async def test_syntax_error():
     """Test handling of syntax errors."""
     code = "x = 1 +"
@@ -71,7 +72,6 @@ async def test_syntax_error():
     assert not result.success
     assert "SyntaxError" in result.error
 
-@pytest.mark.asyncio
 async def test_runtime_error():
     """Test handling of runtime errors."""
     code = """
@@ -82,7 +82,6 @@ async def test_runtime_error():
     assert not result.success
     assert "ZeroDivisionError" in result.error
 
-@pytest.mark.asyncio
 async def test_timeout():
     """Test code execution timeout."""
     code = """
@@ -94,7 +93,6 @@ async def test_timeout():
     assert not result.success
     assert "timed out" in result.error.lower()
 
-@pytest.mark.asyncio
 async def test_complex_code():
     """Test execution of more complex code."""
     code = """
@@ -110,7 +108,9 @@ async def test_complex_code():
     assert result.output == "120"
     assert result.complexity_score > 0.2
 
-@pytest.mark.asyncio
+@requires_cuda
+@pytest.mark.gpu
+@pytest.mark.xdist_group(name="gpu")
 async def test_gpu_numpy():
     """Test GPU-accelerated NumPy operations."""
     code = """
@@ -129,7 +129,6 @@ async def test_gpu_numpy():
     assert result.used_gpu
     assert float(result.output) != 0  # Should be some non-zero value
 
-@pytest.mark.asyncio
 async def test_concurrent_execution():
     """Test concurrent code execution."""
     code1 = """
@@ -154,7 +153,6 @@ async def test_concurrent_execution():
     assert results[0].output == "1"
     assert results[1].output == "2"
 
-@pytest.mark.asyncio
 async def test_output_capture():
     """Test capturing of code output."""
     code = """
@@ -165,7 +163,6 @@ async def test_output_capture():
     assert result.success
     assert result.output == "42"  # Only final result is captured
 
-@pytest.mark.asyncio
 async def test_globals_dict():
     """Test using custom globals dictionary."""
     globals_dict = {
@@ -1,10 +1,9 @@
 """Tests for configuration module."""
 
 import pytest
-import os
 import logging
 from src.config import (
-    Settings,
+    get_settings,
     Config,
     GPUConfig,
     CacheConfig,
@@ -14,8 +13,15 @@ from src.config import (
 
 @pytest.fixture
 def settings():
-    """Create test settings."""
-    return Settings()
+    """Get cached test settings."""
+    return get_settings()
+
+@pytest.fixture
+def clear_settings_cache():
+    """Reset cached settings around environment changes."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
 @pytest.fixture
 def config(settings):
@@ -46,22 +52,17 @@ def test_settings_defaults(settings):
     assert settings.METRICS_ENABLED
     assert settings.METRICS_INTERVAL == 60
 
-def test_settings_from_env():
+def test_settings_from_env(monkeypatch, clear_settings_cache):
     """Test loading settings from environment."""
     # Set test environment variables
-    os.environ["HOST"] = "localhost"
-    os.environ["PORT"] = "9000"
-    os.environ["DEBUG"] = "true"
+    monkeypatch.setenv("HOST", "localhost")
+    monkeypatch.setenv("PORT", "9000")
+    monkeypatch.setenv("DEBUG", "true")
     
-    settings = Settings()
+    settings = get_settings()
     assert settings.HOST == "localhost"
     assert settings.PORT == 9000
     assert settings.DEBUG
-    
-    # Clean up
-    del os.environ["HOST"]
-    del os.environ["PORT"]
-    del os.environ["DEBUG"]
 
 def test_gpu_config():
     """Test GPU configuration."""
@@ -168,23 +169,18 @@ def test_server_settings(config):
     assert settings["reload"] == config.settings.RELOAD
     assert settings["debug"] == config.settings.DEBUG
 
-def test_config_from_env():
+def test_config_from_env(tmp_path, clear_settings_cache):
     """Test configuration from environment file."""
     # Create temporary .env file
-    with open(".env.test", "w") as f:
-        f.write("HOST=localhost\n")
-        f.write("PORT=9000\n")
-        f.write("DEBUG=true\n")
+    env_file = tmp_path / ".env"
+    env_file.write_text("HOST=localhost\nPORT=9000\nDEBUG=true\n")
     
     # Load config from env file
-    config = Config.from_env(".env.test")
+    config = Config.from_env(str(env_file))
     
     assert config.settings.HOST == "localhost"
     assert config.settings.PORT == 9000
     assert config.settings.DEBUG
-    
-    # Clean up
-    os.remove(".env.test")
 
 def test_config_to_dict(config):
     """Test configuration serialization."""
@@ -17,6 +17,37 @@ from src.utils.emoji import (
     QUALITY,
 )
 
+# Category names accepted by get_emoji, mapped to the public dictionaries
+CATEGORY_DICTS = {
+    'test': TEST_STATUS,
+    'code': CODE_GEN,
+    'process': PROCESSING,
+    'ai': AI_ML,
+    'dev': DEV,
+    'file': FILES,
+    'system': SYSTEM,
+    'progress': PROGRESS,
+    'quality': QUALITY,
+}
+
+# Every emoji in the public dictionaries, plus literal spot checks so a wrong
+# value in a dictionary is caught too
+EMOJI_CASES = [
+    (category, key, emoji)
+    for category, emojis in CATEGORY_DICTS.items()
+    for key, emoji in emojis.items()
+] + [
+    ('test', 'pass', '✅'),
+    ('code', 'success', '🎉'),
+    ('process', 'loading', '⌛'),
+    ('ai', 'model', '🤖'),
+    ('dev', 'code', '💻'),
+    ('file', 'read', '📖'),
+    ('system', 'online', '🟢'),
+    ('progress', 'start', '🚦'),
+    ('quality', 'excellent', '🌟'),
+]
+
 def test_emoji_dictionaries():
     """Test that all emoji dictionaries are properly structured."""
     dictionaries = [
@@ -104,17 +135,7 @@ def test_get_quality_indicator():
     assert get_quality_indicator(0.69999) == '👌'
     assert get_quality_indicator(0.49999) == '👎'
 
-@pytest.mark.parametrize("category,key,expected", [
-    ('test', 'pass', '✅'),
-    ('code', 'success', '🎉'),
-    ('process', 'loading', '⌛'),
-    ('ai', 'model', '🤖'),
-    ('dev', 'code', '💻'),
-    ('file', 'read', '📖'),
-    ('system', 'online', '🟢'),
-    ('progress', 'start', '🚦'),
-    ('quality', 'excellent', '🌟'),
-])
+@pytest.mark.parametrize("category,key,expected", EMOJI_CASES)
 def test_emoji_categories(category, key, expected):
     """Test emoji retrieval across all categories."""
     assert get_emoji(category, key) == expected
@@ -3,6 +3,7 @@
 import pytest
 import logging
 import asyncio
+import time
 from src.lib.error_handling import (
     ErrorSeverity,
     ErrorContext,
@@ -24,11 +25,18 @@ def error_context():
         severity=ErrorSeverity.MEDIUM
     )
 
-@pytest.fixture
-def error_handler():
-    """Create test error handler."""
+@pytest.fixture(scope="module")
+def _shared_error_handler():
+    """Create one error handler for the module."""
     return ErrorHandler()
 
+@pytest.fixture
+def error_handler(_shared_error_handler):
+    """Provide the shared error handler, reset after each test."""
+    yield _shared_error_handler
+    _shared_error_handler.error_counts.clear()
+    _shared_error_handler.recovery_strategies.clear()
+
 def test_error_severity():
     """Test error severity enum."""
     assert ErrorSeverity.LOW.value < ErrorSeverity.MEDIUM.value
@@ -68,7 +76,6 @@ def test_error_hierarchy():
     resource_error = ResourceError("Resource unavailable", context)
     assert isinstance(resource_error, AnalyticsError)
 
-@pytest.mark.asyncio
 async def test_recovery_strategy():
     """Test recovery strategy execution."""
     strategy = RecoveryStrategy(
@@ -95,7 +102,6 @@ async def test_recovery_strategy():
         await strategy.execute_with_recovery(failing_func)
     assert attempt_count == 3  # Initial attempt + 2 retries
 
-@pytest.mark.asyncio
 async def test_recovery_with_fallback():
     """Test recovery strategy with fallback."""
     async def fallback_func(*args, **kwargs):
@@ -113,7 +119,6 @@ async def test_recovery_with_fallback():
     result = await strategy.execute_with_recovery(failing_func)
     assert result == "fallback"
 
-@pytest.mark.asyncio
 async def test_error_handling_decorator():
     """Test error handling decorator."""
     strategy = RecoveryStrategy(max_retries=1, retry_delay=0.1)
@@ -144,7 +149,6 @@ def test_register_strategy(error_handler):
     assert error_handler.get_strategy("test_op") == strategy
     assert error_handler.get_strategy("unknown_op") is None
 
-@pytest.mark.asyncio
 async def test_handle_error(error_handler, error_context):
     """Test error handling."""
     error = ValueError("Test error")
@@ -160,7 +164,6 @@ async def test_handle_error(error_handler, error_context):
     assert result is None
     assert error_handler.error_counts["test_operation"] == 2
 
-@pytest.mark.asyncio
 async def test_handle_fatal_error(error_handler):
     """Test handling of fatal errors."""
     context = ErrorContext(
@@ -172,7 +175,6 @@ async def test_handle_fatal_error(error_handler):
     with pytest.raises(ResourceError):
         await error_handler.handle_error(error)
 
-@pytest.mark.asyncio
 async def test_error_recovery_flow():
     """Test complete error recovery flow."""
     handler = ErrorHandler()
@@ -201,21 +203,20 @@ async def test_error_recovery_flow():
     except Exception as e:
         pytest.fail(f"Recovery should have succeeded but got error: {e}")
 
-def test_error_stats(error_handler, error_context):
+async def test_error_stats(error_handler, error_context):
     """Test error statistics collection."""
     # Generate some errors
     error1 = ValueError("Error 1")
     error2 = RuntimeError("Error 2")
     
-    asyncio.run(error_handler.handle_error(error1, error_context))
-    asyncio.run(error_handler.handle_error(error2, error_context))
+    await error_handler.handle_error(error1, error_context)
+    await error_handler.handle_error(error2, error_context)
     
     stats = error_handler.get_error_stats()
     assert stats["total_errors"] == 2
     assert stats["error_counts"]["test_operation"] == 2
     assert "test_operation" in stats["operations_with_errors"]
 
-@pytest.mark.asyncio
 async def test_concurrent_error_handling(error_handler):
     """Test handling concurrent errors."""
     async def generate_error(i):
@@ -230,4 +231,45 @@ async def test_concurrent_error_handling(error_handler):
     
     stats = error_handler.get_error_stats()
     assert stats["total_errors"] == 5
-    assert len(stats["operations_with_errors"]) == 5 
\ No newline at end of file
+    assert len(stats["operations_with_errors"]) == 5
+
+def test_handle_error_concurrency(benchmark, error_handler):
+    """Benchmark handling 100 concurrent errors."""
+    batches = 0
+    
+    async def handle_batch():
+        nonlocal batches
+        batches += 1
+        await asyncio.gather(*[
+            error_handler.handle_error(ValueError("x"), ErrorContext(operation=f"o{i}"))
+            for i in range(100)
+        ])
+    
+    benchmark.group = "error_concurrency"
+    benchmark.pedantic(lambda: asyncio.run(handle_batch()), rounds=5)
+    
+    # Under xdist the benchmark is disabled and runs once, so count actual calls
+    assert batches >= 1
+    assert error_handler.get_error_stats()["total_errors"] == 100 * batches
+
+async def test_concurrent_recovery_backoff():
+    """Test that retry backoff does not block the event loop."""
+    strategy = RecoveryStrategy(
+        max_retries=2,
+        retry_delay=0.2,
+        exponential_backoff=False
+    )
+    
+    async def failing_func():
+        raise ValueError("Test error")
+    
+    # 20 retrying operations should overlap their backoff sleeps
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        strategy.execute_with_recovery(failing_func) for _ in range(20)
+    ], return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    
+    assert all(isinstance(r, ComputationError) for r in results)
+    # One backoff chain is ~0.4s; running the 20 sequentially would take ~8s
+    assert elapsed < 2.0
@@ -1,6 +1,7 @@
 """Tests for GPU operations module."""
 
 import pytest
+import asyncio
 import numpy as np
 from src.lib.gpu_ops import (
     GPUOperations,
@@ -10,22 +11,33 @@ from src.lib.gpu_ops import (
     get_gpu_info
 )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gpu_ops():
-    """Create GPU operations instance."""
+    """Create GPU operations instance shared by the module."""
     return GPUOperations(gpu_enabled=True)
 
-@pytest.fixture
-def sample_data():
+@pytest.fixture(scope="module")
+def sample_data(rng):
     """Create sample data for testing."""
-    np.random.seed(42)
-    return [float(x) for x in np.random.randn(100)]
+    return rng.standard_normal(100).tolist()
+
+@pytest.fixture(scope="module")
+def sample_refs(sample_data):
+    """Precompute numpy reference values for sample_data."""
+    d = np.asarray(sample_data)
+    return {
+        "sum": d.sum(),
+        "std": d.std(),
+        "max": d.max(),
+        "min": d.min(),
+        "norm": np.linalg.norm(d),
+        "mean": d.mean()
+    }
 
 @pytest.fixture
-def matrix_data():
+def matrix_data(rng):
     """Create sample matrix data for testing."""
-    np.random.seed(42)
-    return [float(x) for x in np.random.randn(100)]  # 10x10 matrix
+    return rng.standard_normal(100).tolist()  # 10x10 matrix
 
 def test_gpu_result():
     """Test GPUResult dataclass."""
@@ -63,16 +75,14 @@ def test_gpu_info():
         assert "memory_allocated" in info
         assert "memory_cached" in info
 
-@pytest.mark.asyncio
-async def test_mean(gpu_ops, sample_data):
+async def test_mean(gpu_ops, sample_data, sample_refs):
     """Test mean calculation."""
     result = await gpu_ops.mean.remote(sample_data)
     assert isinstance(result, GPUResult)
-    assert abs(result.value - np.mean(sample_data)) < 1e-5
+    assert abs(result.value - sample_refs["mean"]) < 1e-5
     assert result.computation_time > 0
     assert result.used_gpu == gpu_ops.gpu_enabled
 
-@pytest.mark.asyncio
 async def test_correlation(gpu_ops, matrix_data):
     """Test correlation calculation."""
     result = await gpu_ops.correlation.remote(matrix_data)
@@ -81,7 +91,6 @@ async def test_correlation(gpu_ops, matrix_data):
     assert result.computation_time > 0
     assert result.used_gpu == gpu_ops.gpu_enabled
 
-@pytest.mark.asyncio
 async def test_matrix_multiply(gpu_ops, matrix_data):
     """Test matrix multiplication."""
     result = await gpu_ops.matrix_multiply.remote(matrix_data)
@@ -90,7 +99,6 @@ async def test_matrix_multiply(gpu_ops, matrix_data):
     assert result.computation_time > 0
     assert result.used_gpu == gpu_ops.gpu_enabled
 
-@pytest.mark.asyncio
 async def test_pca(gpu_ops, matrix_data):
     """Test PCA calculation."""
     result = await gpu_ops.pca.remote(matrix_data)
@@ -99,38 +107,25 @@ async def test_pca(gpu_ops, matrix_data):
     assert result.computation_time > 0
     assert result.used_gpu == gpu_ops.gpu_enabled
 
-@pytest.mark.asyncio
-async def test_custom_operations(gpu_ops, sample_data):
+@pytest.mark.parametrize("op", ["sum", "std", "max", "min", "norm"])
+async def test_custom_operations(gpu_ops, sample_data, sample_refs, op):
     """Test custom operations."""
-    operations = ["sum", "std", "max", "min", "norm"]
+    result = await gpu_ops.custom_operation.remote(sample_data, op)
     
-    for op in operations:
-        result = await gpu_ops.custom_operation.remote(sample_data, op)
-        assert isinstance(result, GPUResult)
-        assert isinstance(result.value, float)
-        assert result.computation_time > 0
-        assert result.used_gpu == gpu_ops.gpu_enabled
-        
-        # Verify results against numpy
-        if op == "sum":
-            assert abs(result.value - np.sum(sample_data)) < 1e-5
-        elif op == "std":
-            assert abs(result.value - np.std(sample_data)) < 1e-5
-        elif op == "max":
-            assert abs(result.value - np.max(sample_data)) < 1e-5
-        elif op == "min":
-            assert abs(result.value - np.min(sample_data)) < 1e-5
-        elif op == "norm":
-            assert abs(result.value - np.linalg.norm(sample_data)) < 1e-5
-
-@pytest.mark.asyncio
+    assert isinstance(result, GPUResult)
+    assert isinstance(result.value, float)
+    assert result.computation_time > 0
+    assert result.used_gpu == gpu_ops.gpu_enabled
+    
+    # Verify result against numpy
+    assert abs(result.value - sample_refs[op]) < 1e-5
+
 async def test_invalid_custom_operation(gpu_ops, sample_data):
     """Test invalid custom operation."""
     with pytest.raises(ValueError):
         await gpu_ops.custom_operation.remote(sample_data, "invalid_op")
 
-@pytest.mark.asyncio
-async def test_custom_operation_params(gpu_ops, sample_data):
+async def test_custom_operation_params(gpu_ops, sample_data, sample_refs):
     """Test custom operation with parameters."""
     # Test L1 norm
     result_l1 = await gpu_ops.custom_operation.remote(
@@ -145,27 +140,23 @@ async def test_custom_operation_params(gpu_ops, sample_data):
         sample_data,
         "norm"
     )
-    assert abs(result_l2.value - np.linalg.norm(sample_data)) < 1e-5
+    assert abs(result_l2.value - sample_refs["norm"]) < 1e-5
 
-@pytest.mark.asyncio
-async def test_large_data(gpu_ops):
+async def test_large_data(gpu_ops, rng):
     """Test operations with large data."""
-    large_data = [float(x) for x in np.random.randn(10000)]
+    large_data = rng.standard_normal(10000).tolist()
     
     # Test mean
     result = await gpu_ops.mean.remote(large_data)
     assert abs(result.value - np.mean(large_data)) < 1e-5
     
     # Test matrix multiply (100x100)
-    matrix_data = [float(x) for x in np.random.randn(10000)]
+    matrix_data = rng.standard_normal(10000).tolist()
     result = await gpu_ops.matrix_multiply.remote(matrix_data)
     assert isinstance(result.value, float)
 
-@pytest.mark.asyncio
 async def test_concurrent_operations(gpu_ops, sample_data):
     """Test concurrent GPU operations."""
-    import asyncio
-    
     # Create multiple operations
     operations = [
         gpu_ops.mean.remote(sample_data),
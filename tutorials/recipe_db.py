@@ -1,10 +1,16 @@
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, ForeignKey, Table
-from sqlalchemy.orm import sessionmaker, relationship, DeclarativeBase, Mapped, mapped_column
-from datetime import datetime
+import asyncio
+from collections import OrderedDict
+import numpy as np
+from sqlalchemy import event, make_url, select, func, text, inspect, Column, Integer, String, Float, DateTime, JSON, LargeBinary, ForeignKey, Table, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import relationship, selectinload, DeclarativeBase, Mapped, mapped_column
+from datetime import datetime, timezone
 import json
 from recipe_exceptions import RecipeStorageError, RecipeNotFoundError
-from recipe_validation import RecipeModel, IngredientModel
+from recipe_validation import RecipeModel, utc_now
 
 class Base(DeclarativeBase):
     pass
@@ -59,8 +65,10 @@ class Recipe(Base):
     servings: Mapped[int] = mapped_column(Integer, nullable=False)
     instructions: Mapped[List[str]] = mapped_column(JSON, nullable=False)
     nutrition_info: Mapped[Optional[Dict[str, float]]] = mapped_column(JSON)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Normalized embedding as raw float32 bytes
+    embedding: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
     
     ingredients: Mapped[List[Ingredient]] = relationship("Ingredient", cascade="all, delete-orphan")
     tags: Mapped[List[Tag]] = relationship("Tag", secondary=recipe_tags, backref="recipes")
@@ -69,166 +77,445 @@ class Recipe(Base):
         secondary=recipe_dietary_restrictions, 
         backref="recipes"
     )
+    
+    __table_args__ = (
+        Index('ix_recipe_cat_diff', 'category', 'difficulty'),
+        Index('ix_recipe_prep_cook', 'prep_time', 'cook_time'),
+    )
+
+# Full-text index over recipe name/description, kept in sync by triggers
+_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts
+       USING fts5(name, description, content='recipes', content_rowid='rowid')""",
+    """CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes BEGIN
+         INSERT INTO recipes_fts(rowid, name, description)
+         VALUES (new.rowid, new.name, new.description);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN
+         INSERT INTO recipes_fts(recipes_fts, rowid, name, description)
+         VALUES ('delete', old.rowid, old.name, old.description);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS recipes_fts_au AFTER UPDATE ON recipes BEGIN
+         INSERT INTO recipes_fts(recipes_fts, rowid, name, description)
+         VALUES ('delete', old.rowid, old.name, old.description);
+         INSERT INTO recipes_fts(rowid, name, description)
+         VALUES (new.rowid, new.name, new.description);
+       END""",
+)
+
+_FTS_FILTER = text(
+    "recipes.rowid IN (SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH :fts_query)"
+)
+
+def _fts_query(query: str) -> str:
+    """Build an FTS5 MATCH expression requiring a prefix match on every word."""
+    return " ".join('"' + token.replace('"', '""') + '"*' for token in query.split())
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Mark a stored timestamp as UTC; SQLite hands datetimes back naive."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+def _to_model(recipe: Recipe) -> RecipeModel:
+    """Convert a loaded Recipe row (with ingredients and tags) to a RecipeModel."""
+    # Rows were validated on the way in, so skip re-validating them on the way out
+    return RecipeModel.construct_trusted({
+        "id": recipe.id,
+        "name": recipe.name,
+        "description": recipe.description,
+        "category": recipe.category,
+        "difficulty": recipe.difficulty,
+        "prep_time": recipe.prep_time,
+        "cook_time": recipe.cook_time,
+        "servings": recipe.servings,
+        "instructions": recipe.instructions,
+        "nutrition_info": recipe.nutrition_info,
+        "ingredients": [
+            {
+                "name": ing.name,
+                "amount": ing.amount,
+                "unit": ing.unit,
+                "notes": ing.notes
+            }
+            for ing in recipe.ingredients
+        ],
+        "tags": [tag.name for tag in recipe.tags],
+        "created_at": _as_utc(recipe.created_at),
+        "updated_at": _as_utc(recipe.updated_at)
+    })
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+def _add_embedding_column(conn) -> None:
+    """Add the embedding column to recipe tables created before it existed."""
+    columns = {col["name"] for col in inspect(conn).get_columns("recipes")}
+    if "embedding" not in columns:
+        conn.execute(text("ALTER TABLE recipes ADD COLUMN embedding BLOB"))
+
+def _create_indexes(conn) -> None:
+    """Create recipe indexes missing from tables that create_all left untouched."""
+    for index in Recipe.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+def _create_fts(conn) -> None:
+    """Create the full-text index, backfilling it from existing recipes."""
+    is_new = not inspect(conn).has_table("recipes_fts")
+    for ddl in _FTS_DDL:
+        conn.execute(text(ddl))
+    if is_new:
+        conn.execute(text("INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild')"))
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """Apply WAL journaling and I/O tuning to each new SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 class RecipeDatabase:
-    def __init__(self, db_url: str = "sqlite:///recipes.db"):
-        self.engine = create_engine(db_url)
-        Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
-    
-    async def add_recipe(self, recipe_data: RecipeModel) -> str:
-        """Add a new recipe to the database."""
-        session = self.Session()
-        try:
-            recipe = Recipe(
-                id=recipe_data.id or str(datetime.utcnow().timestamp()),
-                name=recipe_data.name,
-                description=recipe_data.description,
-                category=recipe_data.category.value,
-                difficulty=recipe_data.difficulty.value,
-                prep_time=recipe_data.prep_time,
-                cook_time=recipe_data.cook_time,
-                servings=recipe_data.servings,
-                instructions=recipe_data.instructions,
-                nutrition_info=recipe_data.nutrition_info
+    def __init__(self, db_url: str = "sqlite:///recipes.db", total_cache_size: int = 1024):
+        url = make_url(db_url)
+        # FTS5, the upsert and the PRAGMAs below are SQLite-only
+        if url.get_backend_name() != "sqlite":
+            raise RecipeStorageError(f"Unsupported database backend: {url.get_backend_name()}")
+        url = url.set(drivername="sqlite+aiosqlite")
+        
+        if url.database in (None, "", ":memory:"):
+            # Share the single in-memory database across sessions
+            self.engine = create_async_engine(
+                url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool
             )
-            
-            # Add ingredients
-            recipe.ingredients = [
-                Ingredient(
-                    name=ing.name,
-                    amount=ing.amount,
-                    unit=ing.unit,
-                    notes=ing.notes
-                )
-                for ing in recipe_data.ingredients
-            ]
-            
-            # Add tags
-            for tag_name in recipe_data.tags:
-                tag = session.query(Tag).filter_by(name=tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                recipe.tags.append(tag)
-            
-            session.add(recipe)
-            session.commit()
-            return recipe.id
-            
-        except Exception as e:
-            session.rollback()
-            raise RecipeStorageError(f"Failed to add recipe: {str(e)}")
-        finally:
-            session.close()
+        else:
+            self.engine = create_async_engine(url)
+        event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
+        self.Session = async_sessionmaker(self.engine, expire_on_commit=False)
+        self._schema_ready = False
+        self._schema_lock = asyncio.Lock()
+        # LRU of search totals by (query, filters); cleared on every write
+        self.total_cache_size = total_cache_size
+        self._total_cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        # Embedding matrix loaded on first use, then appended to in place; rows past _emb_count are spare
+        self._emb_ids: Optional[np.ndarray] = None
+        self._emb_categories = np.empty(0, dtype=object)
+        self._emb_buf = np.empty((0, 0), dtype=np.float32)
+        self._emb_count = 0
+        self._emb_writes = 0
+        # Per-category (ids, matrix) copies of the rows above; cleared whenever they change
+        self._emb_by_category: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
     
-    async def get_recipe(self, recipe_id: str) -> RecipeModel:
-        """Get a recipe by ID."""
-        session = self.Session()
-        try:
-            recipe = session.query(Recipe).filter_by(id=recipe_id).first()
-            if not recipe:
-                raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
-            
-            return RecipeModel(
-                id=recipe.id,
-                name=recipe.name,
-                description=recipe.description,
-                category=recipe.category,
-                difficulty=recipe.difficulty,
-                prep_time=recipe.prep_time,
-                cook_time=recipe.cook_time,
-                servings=recipe.servings,
-                instructions=recipe.instructions,
-                nutrition_info=recipe.nutrition_info,
-                ingredients=[
-                    IngredientModel(
+    async def _init(self) -> None:
+        """Create tables and the full-text index on first use."""
+        if self._schema_ready:
+            return
+        async with self._schema_lock:
+            if self._schema_ready:
+                return
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(_add_embedding_column)
+                await conn.run_sync(_create_indexes)
+                await conn.run_sync(_create_fts)
+            self._schema_ready = True
+    
+    async def _get_or_create_tags(self, session: AsyncSession, tag_names: List[str]) -> List[Tag]:
+        """Upsert tags in one statement and load them back in one query."""
+        tag_names = list(dict.fromkeys(tag_names))
+        if not tag_names:
+            return []
+        
+        await session.execute(
+            sqlite_insert(Tag)
+            .values([{"name": name} for name in tag_names])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        tags = {
+            tag.name: tag
+            for tag in await session.scalars(select(Tag).where(Tag.name.in_(tag_names)))
+        }
+        return [tags[name] for name in tag_names]
+    
+    async def _load_recipe(self, session: AsyncSession, recipe_id: str, *relationships) -> Recipe:
+        """Load a recipe with the given relationships eagerly loaded."""
+        recipe = await session.scalar(
+            select(Recipe)
+            .where(Recipe.id == recipe_id)
+            .options(*(selectinload(rel) for rel in relationships))
+        )
+        if not recipe:
+            raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
+        return recipe
+    
+    def _append_embedding(self, recipe_id: str, category: str, embedding: np.ndarray) -> None:
+        """Append a row to the loaded embedding matrix, doubling its buffer when full."""
+        if self._emb_ids is None:
+            return
+        if self._emb_count == 0 and self._emb_buf.shape[1] != embedding.shape[0]:
+            self._emb_buf = np.empty((16, embedding.shape[0]), dtype=np.float32)
+            self._emb_ids = np.empty(16, dtype=object)
+            self._emb_categories = np.empty(16, dtype=object)
+        elif self._emb_count == len(self._emb_buf):
+            capacity = max(16, 2 * self._emb_count)
+            buf = np.empty((capacity, self._emb_buf.shape[1]), dtype=np.float32)
+            buf[:self._emb_count] = self._emb_buf[:self._emb_count]
+            ids = np.empty(capacity, dtype=object)
+            ids[:self._emb_count] = self._emb_ids[:self._emb_count]
+            categories = np.empty(capacity, dtype=object)
+            categories[:self._emb_count] = self._emb_categories[:self._emb_count]
+            self._emb_buf, self._emb_ids, self._emb_categories = buf, ids, categories
+        self._emb_buf[self._emb_count] = embedding
+        self._emb_ids[self._emb_count] = recipe_id
+        self._emb_categories[self._emb_count] = category
+        self._emb_count += 1
+        self._emb_by_category.pop(category, None)
+    
+    def _drop_embeddings(self) -> None:
+        """Forget the loaded embedding matrix so the next read reloads it."""
+        self._emb_writes += 1
+        self._emb_ids = None
+        self._emb_by_category.clear()
+    
+    async def add_recipe(
+        self,
+        recipe_data: RecipeModel,
+        embedding: Optional[List[float]] = None
+    ) -> str:
+        """Add a new recipe to the database, with an optional embedding."""
+        await self._init()
+        async with self.Session() as session:
+            try:
+                recipe = Recipe(
+                    id=recipe_data.id or str(utc_now().timestamp()),
+                    name=recipe_data.name,
+                    description=recipe_data.description,
+                    category=recipe_data.category.value,
+                    difficulty=recipe_data.difficulty.value,
+                    prep_time=recipe_data.prep_time,
+                    cook_time=recipe_data.cook_time,
+                    servings=recipe_data.servings,
+                    instructions=recipe_data.instructions,
+                    nutrition_info=recipe_data.nutrition_info,
+                    embedding=(
+                        np.asarray(embedding, dtype=np.float32).tobytes()
+                        if embedding is not None else None
+                    )
+                )
+                
+                # Add ingredients
+                recipe.ingredients = [
+                    Ingredient(
                         name=ing.name,
                         amount=ing.amount,
                         unit=ing.unit,
                         notes=ing.notes
                     )
-                    for ing in recipe.ingredients
-                ],
-                tags=[tag.name for tag in recipe.tags],
-                created_at=recipe.created_at,
-                updated_at=recipe.updated_at
-            )
-            
-        except RecipeNotFoundError:
-            raise
-        except Exception as e:
-            raise RecipeStorageError(f"Failed to get recipe: {str(e)}")
-        finally:
-            session.close()
+                    for ing in recipe_data.ingredients
+                ]
+                
+                # Add tags
+                recipe.tags = await self._get_or_create_tags(session, recipe_data.tags)
+                
+                session.add(recipe)
+                await session.commit()
+                self._total_cache.clear()
+                if recipe.embedding is not None:
+                    self._emb_writes += 1
+                    self._append_embedding(
+                        recipe.id, recipe.category, np.frombuffer(recipe.embedding, dtype=np.float32)
+                    )
+                return recipe.id
+                
+            except Exception as e:
+                await session.rollback()
+                raise RecipeStorageError(f"Failed to add recipe: {str(e)}")
+    
+    async def get_recipe(self, recipe_id: str) -> RecipeModel:
+        """Get a recipe by ID."""
+        await self._init()
+        async with self.Session() as session:
+            try:
+                recipe = await self._load_recipe(session, recipe_id, Recipe.ingredients, Recipe.tags)
+                
+                return _to_model(recipe)
+                
+            except RecipeNotFoundError:
+                raise
+            except Exception as e:
+                raise RecipeStorageError(f"Failed to get recipe: {str(e)}")
+    
+    async def get_recipes_by_ids(self, recipe_ids: List[str]) -> Dict[str, RecipeModel]:
+        """Get several recipes in one query, keyed by ID; missing IDs are omitted."""
+        await self._init()
+        if not recipe_ids:
+            return {}
+        async with self.Session() as session:
+            try:
+                recipes = await session.scalars(
+                    select(Recipe)
+                    .where(Recipe.id.in_(recipe_ids))
+                    .options(selectinload(Recipe.ingredients), selectinload(Recipe.tags))
+                )
+                return {recipe.id: _to_model(recipe) for recipe in recipes}
+                
+            except Exception as e:
+                raise RecipeStorageError(f"Failed to get recipes: {str(e)}")
+    
+    async def get_recipe_embedding(self, recipe_id: str) -> Optional[np.ndarray]:
+        """Get a recipe's stored embedding, or None if it has none."""
+        await self._init()
+        async with self.Session() as session:
+            try:
+                row = (await session.execute(
+                    select(Recipe.embedding).where(Recipe.id == recipe_id)
+                )).first()
+                if row is None:
+                    raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
+                
+                return np.frombuffer(row.embedding, dtype=np.float32) if row.embedding else None
+                
+            except RecipeNotFoundError:
+                raise
+            except Exception as e:
+                raise RecipeStorageError(f"Failed to get recipe embedding: {str(e)}")
+    
+    async def get_embedding_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get recipe ids and their embeddings as one contiguous float32 matrix.
+        
+        Both arrays are read-only views of a cache kept in step with writes.
+        """
+        ids, _, matrix = await self._embedding_rows()
+        return ids, matrix
+    
+    async def get_category_embeddings(self, category: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get ids and embeddings of the recipes in one category."""
+        if category in self._emb_by_category:
+            return self._emb_by_category[category]
+        writes = self._emb_writes
+        ids, categories, matrix = await self._embedding_rows()
+        mask = categories == category
+        bucket = (ids[mask], matrix[mask])
+        bucket[0].flags.writeable = bucket[1].flags.writeable = False
+        # Only cache buckets cut from the cached rows, not from a snapshot a write raced
+        if writes == self._emb_writes and self._emb_ids is not None:
+            self._emb_by_category[category] = bucket
+        return bucket
+    
+    async def _embedding_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get read-only (ids, categories, matrix) views, loading them on first use."""
+        await self._init()
+        if self._emb_ids is None:
+            writes = self._emb_writes
+            rows = await self._load_embedding_rows()
+            if writes != self._emb_writes:
+                # A write landed mid-load; serve this snapshot but don't cache it
+                return rows
+            self._emb_ids, self._emb_categories, self._emb_buf = rows
+            self._emb_count = len(self._emb_ids)
+        ids = self._emb_ids[:self._emb_count]
+        categories = self._emb_categories[:self._emb_count]
+        matrix = self._emb_buf[:self._emb_count]
+        ids.flags.writeable = categories.flags.writeable = matrix.flags.writeable = False
+        return ids, categories, matrix
+    
+    async def _load_embedding_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read every stored embedding into (ids, categories, matrix) arrays."""
+        async with self.Session() as session:
+            try:
+                rows = (await session.execute(
+                    select(Recipe.id, Recipe.category, Recipe.embedding)
+                    .where(Recipe.embedding.is_not(None))
+                )).all()
+                
+                ids = np.empty(len(rows), dtype=object)
+                ids[:] = [row.id for row in rows]
+                categories = np.empty(len(rows), dtype=object)
+                categories[:] = [row.category for row in rows]
+                if not rows:
+                    return ids, categories, np.empty((0, 0), dtype=np.float32)
+                matrix = np.frombuffer(b"".join(row.embedding for row in rows), dtype=np.float32)
+                return ids, categories, matrix.reshape(len(rows), -1)
+                
+            except Exception as e:
+                raise RecipeStorageError(f"Failed to load embeddings: {str(e)}")
+    
+    async def get_all_embeddings(self) -> Dict[str, np.ndarray]:
+        """Get all stored embeddings keyed by recipe ID."""
+        ids, matrix = await self.get_embedding_matrix()
+        return dict(zip(ids, matrix))
     
     async def update_recipe(self, recipe_id: str, recipe_data: RecipeModel) -> None:
         """Update an existing recipe."""
-        session = self.Session()
-        try:
-            recipe = session.query(Recipe).filter_by(id=recipe_id).first()
-            if not recipe:
-                raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
-            
-            # Update basic fields
-            recipe.name = recipe_data.name
-            recipe.description = recipe_data.description
-            recipe.category = recipe_data.category.value
-            recipe.difficulty = recipe_data.difficulty.value
-            recipe.prep_time = recipe_data.prep_time
-            recipe.cook_time = recipe_data.cook_time
-            recipe.servings = recipe_data.servings
-            recipe.instructions = recipe_data.instructions
-            recipe.nutrition_info = recipe_data.nutrition_info
-            
-            # Update ingredients
-            recipe.ingredients = []
-            recipe.ingredients = [
-                Ingredient(
-                    name=ing.name,
-                    amount=ing.amount,
-                    unit=ing.unit,
-                    notes=ing.notes
-                )
-                for ing in recipe_data.ingredients
-            ]
-            
-            # Update tags
-            recipe.tags = []
-            for tag_name in recipe_data.tags:
-                tag = session.query(Tag).filter_by(name=tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                recipe.tags.append(tag)
-            
-            session.commit()
-            
-        except RecipeNotFoundError:
-            raise
-        except Exception as e:
-            session.rollback()
-            raise RecipeStorageError(f"Failed to update recipe: {str(e)}")
-        finally:
-            session.close()
+        await self._init()
+        async with self.Session() as session:
+            try:
+                recipe = await self._load_recipe(session, recipe_id, Recipe.ingredients, Recipe.tags)
+                
+                # Update basic fields
+                recipe.name = recipe_data.name
+                recipe.description = recipe_data.description
+                category_changed = recipe.category != recipe_data.category.value
+                recipe.category = recipe_data.category.value
+                recipe.difficulty = recipe_data.difficulty.value
+                recipe.prep_time = recipe_data.prep_time
+                recipe.cook_time = recipe_data.cook_time
+                recipe.servings = recipe_data.servings
+                recipe.instructions = recipe_data.instructions
+                recipe.nutrition_info = recipe_data.nutrition_info
+                
+                # Update ingredients in place by name; unmatched rows are orphaned and deleted
+                existing = {ing.name: ing for ing in recipe.ingredients}
+                ingredients = []
+                for ing in recipe_data.ingredients:
+                    row = existing.pop(ing.name, None)
+                    if row is None:
+                        row = Ingredient(name=ing.name, amount=ing.amount, unit=ing.unit, notes=ing.notes)
+                    elif (row.amount, row.unit, row.notes) != (ing.amount, ing.unit, ing.notes):
+                        row.amount, row.unit, row.notes = ing.amount, ing.unit, ing.notes
+                    ingredients.append(row)
+                recipe.ingredients = ingredients
+                
+                # Update tags
+                recipe.tags = await self._get_or_create_tags(session, recipe_data.tags)
+                
+                await session.commit()
+                self._total_cache.clear()
+                if category_changed:
+                    self._drop_embeddings()
+                
+            except RecipeNotFoundError:
+                raise
+            except Exception as e:
+                await session.rollback()
+                raise RecipeStorageError(f"Failed to update recipe: {str(e)}")
     
     async def delete_recipe(self, recipe_id: str) -> None:
         """Delete a recipe by ID."""
-        session = self.Session()
-        try:
-            recipe = session.query(Recipe).filter_by(id=recipe_id).first()
-            if not recipe:
-                raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
-            
-            session.delete(recipe)
-            session.commit()
-            
-        except RecipeNotFoundError:
-            raise
-        except Exception as e:
-            session.rollback()
-            raise RecipeStorageError(f"Failed to delete recipe: {str(e)}")
-        finally:
-            session.close()
-    
+        await self._init()
+        async with self.Session() as session:
+            try:
+                recipe = await self._load_recipe(
+                    session, recipe_id,
+                    Recipe.ingredients, Recipe.tags, Recipe.dietary_restrictions
+                )
+                
+                await session.delete(recipe)
+                await session.commit()
+                self._total_cache.clear()
+                self._drop_embeddings()
+                
+            except RecipeNotFoundError:
+                raise
+            except Exception as e:
+                await session.rollback()
+                raise RecipeStorageError(f"Failed to delete recipe: {str(e)}")
     async def search_recipes(
         self, 
         query: str, 
@@ -237,70 +524,64 @@ class RecipeDatabase:
         filters: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[RecipeModel], int]:
         """Search recipes with pagination and filters."""
-        session = self.Session()
-        try:
-            # Base query
-            q = session.query(Recipe)
-            
-            # Apply text search
-            if query:
-                q = q.filter(Recipe.name.ilike(f"%{query}%") | Recipe.description.ilike(f"%{query}%"))
-            
-            # Apply filters
-            if filters:
-                if "category" in filters:
-                    q = q.filter(Recipe.category == filters["category"])
-                if "difficulty" in filters:
-                    q = q.filter(Recipe.difficulty == filters["difficulty"])
-                if "max_prep_time" in filters:
-                    q = q.filter(Recipe.prep_time <= filters["max_prep_time"])
-                if "max_cook_time" in filters:
-                    q = q.filter(Recipe.cook_time <= filters["max_cook_time"])
-                if "tags" in filters:
-                    q = q.join(Recipe.tags).filter(Tag.name.in_(filters["tags"]))
-                if "dietary_restrictions" in filters:
-                    q = q.join(Recipe.dietary_restrictions).filter(
-                        DietaryRestriction.name.in_(filters["dietary_restrictions"])
-                    )
-            
-            # Get total count
-            total = q.count()
-            
-            # Apply pagination
-            recipes = q.offset((page - 1) * per_page).limit(per_page).all()
-            
-            # Convert to models
-            recipe_models = [
-                RecipeModel(
-                    id=recipe.id,
-                    name=recipe.name,
-                    description=recipe.description,
-                    category=recipe.category,
-                    difficulty=recipe.difficulty,
-                    prep_time=recipe.prep_time,
-                    cook_time=recipe.cook_time,
-                    servings=recipe.servings,
-                    instructions=recipe.instructions,
-                    nutrition_info=recipe.nutrition_info,
-                    ingredients=[
-                        IngredientModel(
-                            name=ing.name,
-                            amount=ing.amount,
-                            unit=ing.unit,
-                            notes=ing.notes
-                        )
-                        for ing in recipe.ingredients
-                    ],
-                    tags=[tag.name for tag in recipe.tags],
-                    created_at=recipe.created_at,
-                    updated_at=recipe.updated_at
+        await self._init()
+        async with self.Session() as session:
+            try:
+                # Base query
+                stmt = select(Recipe)
+                
+                # Apply text search
+                fts_query = _fts_query(query) if query else ""
+                if fts_query:
+                    stmt = stmt.where(_FTS_FILTER.bindparams(fts_query=fts_query))
+                
+                # Apply filters
+                if filters:
+                    if "category" in filters:
+                        stmt = stmt.where(Recipe.category == filters["category"])
+                    if "difficulty" in filters:
+                        stmt = stmt.where(Recipe.difficulty == filters["difficulty"])
+                    if "max_prep_time" in filters:
+                        stmt = stmt.where(Recipe.prep_time <= filters["max_prep_time"])
+                    if "max_cook_time" in filters:
+                        stmt = stmt.where(Recipe.cook_time <= filters["max_cook_time"])
+                    # EXISTS rather than joins, so a recipe matching several values is one row
+                    if "tags" in filters:
+                        stmt = stmt.where(Recipe.tags.any(Tag.name.in_(filters["tags"])))
+                    if "dietary_restrictions" in filters:
+                        stmt = stmt.where(Recipe.dietary_restrictions.any(
+                            DietaryRestriction.name.in_(filters["dietary_restrictions"])
+                        ))
+                
+                # Fetch the page with the total count fused in via a window function,
+                # loading ingredients and tags in one batched query each
+                page_stmt = (
+                    stmt.add_columns(func.count().over().label("total"))
+                    .options(selectinload(Recipe.ingredients), selectinload(Recipe.tags))
+                    .offset((page - 1) * per_page)
+                    .limit(per_page)
                 )
-                for recipe in recipes
-            ]
-            
-            return recipe_models, total
-            
-        except Exception as e:
-            raise RecipeStorageError(f"Failed to search recipes: {str(e)}")
-        finally:
-            session.close() 
\ No newline at end of file
+                rows = (await session.execute(page_stmt)).all()
+                recipes = [row.Recipe for row in rows]
+                
+                # Window count is unavailable on an empty page; fall back to the
+                # last known total before issuing a separate COUNT
+                cache_key = (fts_query, json.dumps(filters or {}, sort_keys=True, default=str))
+                if rows:
+                    total = rows[0].total
+                elif cache_key in self._total_cache:
+                    total = self._total_cache[cache_key]
+                else:
+                    total = await session.scalar(select(func.count()).select_from(stmt.subquery()))
+                self._total_cache[cache_key] = total
+                self._total_cache.move_to_end(cache_key)
+                while len(self._total_cache) > self.total_cache_size:
+                    self._total_cache.popitem(last=False)
+                
+                # Convert to models
+                recipe_models = [_to_model(recipe) for recipe in recipes]
+                
+                return recipe_models, total
+                
+            except Exception as e:
+                raise RecipeStorageError(f"Failed to search recipes: {str(e)}")
\ No newline at end of file
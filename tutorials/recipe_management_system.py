@@ -3,6 +3,7 @@ import modal
 from datetime import datetime
 import asyncio
 import logging
+import numpy as np
 import json
 from pathlib import Path
 
@@ -12,10 +13,10 @@ from recipe_exceptions import (
 )
 from recipe_validation import (
     RecipeModel, IngredientModel, validate_recipe_data,
-    validate_search_query, validate_meal_plan_preferences
+    SearchQueryIn, validate_search_query, validate_meal_plan_preferences
 )
 from tutorials.recipe_db import RecipeDatabase
-from recipe_ml import MLManager
+from recipe_ml import MLManager, MEAL_CATEGORIES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -49,32 +50,38 @@ class RecipeManager:
             # Validate recipe data
             recipe_model = validate_recipe_data(recipe_data)
             
-            # Generate recipe embedding
-            recipe_embedding = self.ml.generate_recipe_embedding(recipe_model)
-            
-            # Add recipe to database
-            recipe_id = self.db.add_recipe(recipe_model, recipe_embedding)
-            
-            # Get recipe for analysis
-            recipe = self.db.get_recipe(recipe_id)
+            # Generate recipe embedding while loading existing ones
+            recipe_embedding, (existing_ids, existing_embeddings) = await asyncio.gather(
+                asyncio.to_thread(self.ml.generate_recipe_embedding, recipe_model),
+                self.db.get_embedding_matrix()
+            )
             
-            # Generate analysis and recommendations
-            similar_recipes = self.ml.find_similar_recipes(
-                recipe_embedding,
-                self.db.get_all_embeddings()
+            # Store the recipe while ranking similar recipes and generating tips
+            recipe_id, similar_recipes, cooking_tips = await asyncio.gather(
+                self.db.add_recipe(recipe_model, recipe_embedding),
+                asyncio.to_thread(
+                    self.ml.find_similar_recipes,
+                    recipe_embedding,
+                    existing_ids,
+                    existing_embeddings
+                ),
+                asyncio.to_thread(self.ml.generate_recipe_tips, recipe_model)
             )
             
+            similar = await self.db.get_recipes_by_ids([rid for rid, _ in similar_recipes])
+            
             return {
                 "recipe_id": recipe_id,
                 "analysis": {
-                    "nutrition": recipe.nutrition_info,
-                    "cooking_tips": self.ml.generate_recipe_tips(recipe),
+                    "nutrition": recipe_model.nutrition_info,
+                    "cooking_tips": cooking_tips,
                     "similar_recipes": [
                         {
-                            "recipe": self.db.get_recipe(recipe_id),
+                            "recipe": similar[similar_id],
                             "similarity_score": score
                         }
-                        for recipe_id, score in similar_recipes
+                        for similar_id, score in similar_recipes
+                        if similar_id in similar
                     ]
                 }
             }
@@ -89,25 +96,25 @@ class RecipeManager:
             logger.error(f"Failed to add recipe: {str(e)}")
             raise RecipeError(f"Failed to add recipe: {str(e)}")
             
-    async def search_recipes(self, search_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def search_recipes(self, search_data: SearchQueryIn) -> Dict[str, Any]:
         """Search recipes using ML-powered similarity search"""
         try:
             # Validate search query
             search_model = validate_search_query(search_data)
             
             # Search recipes
-            recipes, total = self.db.search_recipes(
-                search_model.query,
-                search_model.filters,
-                search_model.page,
-                search_model.page_size
+            recipes, total = await self.db.search_recipes(
+                search_model["query"],
+                search_model["page"],
+                search_model["per_page"],
+                search_model["filters"]
             )
             
             return {
                 "results": recipes,
                 "total": total,
-                "page": search_model.page,
-                "page_size": search_model.page_size
+                "page": search_model["page"],
+                "page_size": search_model["per_page"]
             }
             
         except RecipeValidationError as e:
@@ -121,24 +128,29 @@ class RecipeManager:
         """Analyze recipe for nutrition, complexity, and suggestions"""
         try:
             # Get recipe
-            recipe = self.db.get_recipe(recipe_id)
-            recipe_embedding = self.db.get_recipe_embedding(recipe_id)
+            recipe, recipe_embedding, (all_ids, all_embeddings) = await asyncio.gather(
+                self.db.get_recipe(recipe_id),
+                self.db.get_recipe_embedding(recipe_id),
+                self.db.get_embedding_matrix()
+            )
             
             # Generate analysis
-            similar_recipes = self.ml.find_similar_recipes(
-                recipe_embedding,
-                self.db.get_all_embeddings()
+            similar_recipes = (
+                self.ml.find_similar_recipes(recipe_embedding, all_ids, all_embeddings)
+                if recipe_embedding is not None else []
             )
+            similar = await self.db.get_recipes_by_ids([rid for rid, _ in similar_recipes])
             
             return {
                 "nutrition": recipe.nutrition_info,
                 "cooking_tips": self.ml.generate_recipe_tips(recipe),
                 "similar_recipes": [
                     {
-                        "recipe": self.db.get_recipe(recipe_id),
+                        "recipe": similar[similar_id],
                         "similarity_score": score
                     }
-                    for recipe_id, score in similar_recipes
+                    for similar_id, score in similar_recipes
+                    if similar_id in similar
                 ],
                 "complexity_analysis": {
                     "prep_complexity": len(recipe.instructions) / 5,
@@ -159,35 +171,34 @@ class RecipeManager:
             # Validate preferences
             preferences = validate_meal_plan_preferences(preferences_data)
             
-            # Get all recipes
-            recipes = self.db.search_recipes("", {}, page_size=1000)[0]
+            # Get stored embeddings bucketed by the category each meal draws from
+            categories = list(dict.fromkeys(MEAL_CATEGORIES.values()))
+            buckets = await asyncio.gather(*(
+                self.db.get_category_embeddings(category) for category in categories
+            ))
+            candidates = dict(zip(categories, buckets))
+            if any(len(ids) == 0 for ids, _ in buckets):
+                # Fall back to every recipe for a category that has none of its own
+                everything = await self.db.get_embedding_matrix()
+                candidates = {
+                    category: bucket if len(bucket[0]) else everything
+                    for category, bucket in candidates.items()
+                }
             
-            # Generate recommendations for each meal
-            meal_plan = []
-            for day in range(preferences_data.get("days", 7)):
-                # Get recommendations for each meal type
-                breakfast = self.ml.recommend_recipes(
-                    {**preferences.dict(), "category": "breakfast"},
-                    recipes,
-                    top_k=1
-                )
-                lunch = self.ml.recommend_recipes(
-                    {**preferences.dict(), "category": "main_course"},
-                    recipes,
-                    top_k=1
-                )
-                dinner = self.ml.recommend_recipes(
-                    {**preferences.dict(), "category": "main_course"},
-                    recipes,
-                    top_k=1
-                )
-                
-                meal_plan.append({
-                    "day": day + 1,
-                    "breakfast": breakfast[0] if breakfast else None,
-                    "lunch": lunch[0] if lunch else None,
-                    "dinner": dinner[0] if dinner else None
-                })
+            # Rank each meal's category against its own bucket only
+            planned = await asyncio.to_thread(
+                self.ml.plan_meals,
+                preferences.model_dump(),
+                candidates,
+                preferences.days
+            )
+            recipes = await self.db.get_recipes_by_ids(list({
+                day[meal] for day in planned for meal in MEAL_CATEGORIES if day[meal]
+            }))
+            meal_plan = [
+                {"day": day["day"], **{meal: recipes.get(day[meal]) for meal in MEAL_CATEGORIES}}
+                for day in planned
+            ]
             
             # Calculate nutrition summary
             nutrition_summary = self._calculate_meal_plan_nutrition(meal_plan)
@@ -206,30 +217,37 @@ class RecipeManager:
             
     def _calculate_meal_plan_nutrition(self, meal_plan: List[Dict[str, Any]]) -> Dict[str, float]:
         """Calculate nutrition summary for meal plan"""
-        total_nutrition = {
-            "calories": 0,
-            "protein": 0,
-            "carbs": 0,
-            "fat": 0
-        }
+        keys = ("calories", "protein", "carbs", "fat")
         
-        for day in meal_plan:
-            for meal in ["breakfast", "lunch", "dinner"]:
-                if day[meal] and day[meal].nutrition_info:
-                    for key in total_nutrition:
-                        total_nutrition[key] += day[meal].nutrition_info.get(key, 0)
+        # One row per planned meal, summed in a single pass
+        nutrition = np.array([
+            [day[meal].nutrition_info.get(key, 0) for key in keys]
+            for day in meal_plan
+            for meal in ("breakfast", "lunch", "dinner")
+            if day[meal] and day[meal].nutrition_info
+        ], dtype=np.float64).reshape(-1, len(keys))
+        averages = (nutrition.sum(axis=0) / len(meal_plan)).round(1)
         
-        days = len(meal_plan)
         return {
-            f"average_daily_{key}": round(value / days, 1)
-            for key, value in total_nutrition.items()
+            f"average_daily_{key}": float(value)
+            for key, value in zip(keys, averages)
         }
 
+# Built on first command and reused, so the embedding model loads once per container
+_manager: Optional[RecipeManager] = None
+
+def _get_manager() -> RecipeManager:
+    """Get the shared RecipeManager, creating it on first use"""
+    global _manager
+    if _manager is None:
+        _manager = RecipeManager()
+    return _manager
+
 @app.function(volumes={"/data": recipe_volume}, image=image)
 async def process_recipe_command(command_type: str, command_data: Dict[str, Any]) -> Dict[str, Any]:
     """Process a recipe command"""
     try:
-        manager = RecipeManager()
+        manager = _get_manager()
         
         if command_type == "add_recipe":
             result = await manager.add_recipe(command_data)
@@ -321,7 +339,7 @@ def main():
                     "difficulty": "medium"
                 },
                 "page": 1,
-                "page_size": 10
+                "per_page": 10
             }
         )
         
@@ -1,8 +1,13 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import random
+import re
+import threading
 import numpy as np
 from transformers import AutoTokenizer, AutoModel
 import torch
-from sklearn.metrics.pairwise import cosine_similarity
 from recipe_exceptions import RecipeMLError
 from recipe_validation import RecipeModel, IngredientModel
 import json
@@ -10,38 +15,107 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Dedicated RNG for tip selection
+_rng = random.Random()
+
 class RecipeEmbeddingModel:
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        cache_size: int = 4096,
+        quantize: bool = False
+    ):
+        # LRU of normalized embeddings keyed by text digest
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # The manager is shared across worker threads: the fast tokenizer isn't
+        # thread-safe and the LRU's check-then-move isn't atomic
+        self._cache_lock = threading.Lock()
+        self._model_lock = threading.Lock()
         try:
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
             self.model = AutoModel.from_pretrained(model_name)
             self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
             self.model.to(self.device)
+            self.model.eval()
+            if self.device.type == "cuda":
+                # Half-precision weights; pooling below is done in fp32
+                self.model.half()
+            elif quantize:
+                # Opt-in int8 dynamic quantization of the Linear layers; changes the
+                # vectors, so stored embeddings must come from the same setting
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
             logger.info(f"Loaded recipe embedding model on {self.device}")
         except Exception as e:
             raise RecipeMLError(f"Failed to load embedding model: {str(e)}")
 
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for recipe text"""
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate normalized float32 embedding for recipe text"""
+        return self.generate_embeddings([text])[0]
+
+    def generate_embeddings(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Generate normalized embeddings for many texts, encoding only uncached ones"""
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).hexdigest() for text in texts]
+        by_key = dict(zip(keys, texts))
+        
+        found = {}
+        with self._cache_lock:
+            for key in by_key:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+        
+        missing = [key for key in by_key if key not in found]
+        if missing:
+            with self._model_lock:
+                encoded = self._encode([by_key[key] for key in missing], batch_size)
+            with self._cache_lock:
+                for key, embedding in zip(missing, encoded):
+                    found[key] = self._cache[key] = embedding.copy()
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    def _encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Run the model over texts, one forward pass per batch"""
         try:
-            # Tokenize and prepare input
-            inputs = self.tokenizer(
-                text,
-                padding=True,
-                truncation=True,
-                max_length=512,
-                return_tensors="pt"
-            ).to(self.device)
+            # Batch texts of similar length together so each batch pads to its own max
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            ordered_texts = [texts[i] for i in order]
             
-            # Generate embeddings
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                embeddings = outputs.last_hidden_state.mean(dim=1)
+            batches = []
+            for i in range(0, len(ordered_texts), batch_size):
+                # Tokenize and prepare input
+                inputs = self.tokenizer(
+                    ordered_texts[i:i + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=512,
+                    return_tensors="pt"
+                ).to(self.device)
                 
-            # Convert to numpy and normalize
-            embedding = embeddings[0].cpu().numpy()
-            normalized_embedding = embedding / np.linalg.norm(embedding)
-            return normalized_embedding.tolist()
+                # Mean-pool over real tokens only, then normalize
+                with torch.inference_mode():
+                    outputs = self.model(**inputs)
+                    hidden = outputs.last_hidden_state.float()
+                    mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                    embeddings = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                    embeddings = torch.nn.functional.normalize(embeddings, dim=1)
+                batches.append(embeddings.cpu().numpy())
+            
+            if not batches:
+                return np.empty((0, 0), dtype=np.float32)
+            
+            # Restore input order
+            sorted_embeddings = np.concatenate(batches)
+            embeddings = np.empty_like(sorted_embeddings)
+            embeddings[order] = sorted_embeddings
+            return embeddings
             
         except Exception as e:
             raise RecipeMLError(f"Failed to generate embedding: {str(e)}")
@@ -58,7 +132,7 @@ class RecipeEmbeddingModel:
         return " ".join(text_parts)
 
 class RecipeNutritionModel:
-    def __init__(self):
+    def __init__(self, match_cache_size: int = 4096):
         # Load nutrition data (could be replaced with a real ML model)
         self.nutrition_data = {
             # Basic ingredients (per 100g/ml)
@@ -90,37 +164,43 @@ class RecipeNutritionModel:
             "pinch": 1,
             "dash": 1
         }
+        
+        # Nutrient table as an (ingredient x nutrient) array for vectorized totals
+        self._nutrients = ("calories", "protein", "carbs", "fat")
+        self._name_to_idx = {name: i for i, name in enumerate(self.nutrition_data)}
+        self._table = np.array(
+            [[values[n] for n in self._nutrients] for values in self.nutrition_data.values()],
+            dtype=np.float64
+        )
+        
+        # LRU of resolved ingredient names, including misses; per instance so it doesn't pin self
+        self._match_ingredient = lru_cache(maxsize=match_cache_size)(self._match_ingredient)
 
     def analyze_nutrition(self, ingredients: List[IngredientModel]) -> Dict[str, float]:
         """Analyze recipe nutrition based on ingredients"""
         try:
-            total_nutrition = {
-                "calories": 0,
-                "protein": 0,
-                "carbs": 0,
-                "fat": 0
-            }
-            
+            rows = []
+            amounts = []
             for ingredient in ingredients:
                 # Find best matching ingredient in database
                 ing_name = self._find_matching_ingredient(ingredient.name)
                 if not ing_name:
                     continue
+                rows.append(self._name_to_idx[ing_name])
                     
                 # Convert amount to grams/ml
-                amount_in_base = ingredient.amount * self.unit_conversions.get(
+                amounts.append(ingredient.amount * self.unit_conversions.get(
                     ingredient.unit.lower(),
                     1  # default to 1 if unit not found
-                )
-                
-                # Calculate nutrition values
-                for nutrient, base_value in self.nutrition_data[ing_name].items():
-                    total_nutrition[nutrient] += (base_value * amount_in_base) / 100
+                ))
+            
+            # Calculate nutrition values per 100g/ml in one reduction
+            totals = (self._table[rows] * np.asarray(amounts)[:, None]).sum(axis=0) / 100
                     
             # Round values
             return {
-                key: round(value, 1)
-                for key, value in total_nutrition.items()
+                key: round(float(value), 1)
+                for key, value in zip(self._nutrients, totals)
             }
             
         except Exception as e:
@@ -128,46 +208,109 @@ class RecipeNutritionModel:
 
     def _find_matching_ingredient(self, name: str) -> Optional[str]:
         """Find best matching ingredient in database"""
-        name = name.lower()
+        return self._match_ingredient(name.lower())
+
+    def _match_ingredient(self, name: str) -> Optional[str]:
+        """Match a lowercased ingredient name, directly or partially"""
         # Direct match
         if name in self.nutrition_data:
             return name
+        
         # Partial match
         for ing_name in self.nutrition_data:
             if ing_name in name or name in ing_name:
                 return ing_name
         return None
 
+# Recipe category served for each meal
+MEAL_CATEGORIES = {
+    "breakfast": "breakfast",
+    "lunch": "main_course",
+    "dinner": "main_course"
+}
+
 class RecipeRecommender:
     def __init__(self, embedding_model: RecipeEmbeddingModel):
         self.embedding_model = embedding_model
         
     def find_similar_recipes(
         self,
-        query_embedding: List[float],
-        recipe_embeddings: Dict[str, List[float]],
+        query_embedding: np.ndarray,
+        recipe_ids: Sequence[str],
+        embeddings: np.ndarray,
         top_k: int = 5
     ) -> List[tuple[str, float]]:
-        """Find similar recipes using cosine similarity"""
+        """Find similar recipes using cosine similarity against an (N, d) embedding matrix"""
         try:
-            if not recipe_embeddings:
+            if len(recipe_ids) == 0:
                 return []
                 
-            # Convert embeddings to numpy array
-            query_embedding = np.array(query_embedding).reshape(1, -1)
-            recipe_ids = list(recipe_embeddings.keys())
-            embeddings = np.array([recipe_embeddings[rid] for rid in recipe_ids])
+            # Stored embeddings are L2-normalized, so cosine similarity is a dot product
+            query = np.asarray(query_embedding, dtype=np.float32)
+            query = query / np.linalg.norm(query)
+            similarities = embeddings @ query
             
-            # Calculate similarities
-            similarities = cosine_similarity(query_embedding, embeddings)[0]
-            
-            # Get top-k similar recipes
-            similar_indices = similarities.argsort()[-top_k:][::-1]
+            # Select top-k without a full sort, then order just those
+            k = min(top_k, len(recipe_ids))
+            if k < len(recipe_ids):
+                top_indices = np.argpartition(-similarities, k - 1)[:k]
+            else:
+                top_indices = np.arange(k)
+            similar_indices = top_indices[np.argsort(-similarities[top_indices])]
             return [(recipe_ids[i], float(similarities[i])) for i in similar_indices]
             
         except Exception as e:
             raise RecipeMLError(f"Failed to find similar recipes: {str(e)}")
             
+    @staticmethod
+    def preference_text(user_preferences: Dict[str, Any]) -> str:
+        """Flatten scalar preference values into text for embedding"""
+        return " ".join([
+            str(value) for value in user_preferences.values()
+            if isinstance(value, (str, int, float))
+        ])
+            
+    def plan_meals(
+        self,
+        user_preferences: Dict[str, Any],
+        candidates: Dict[str, Tuple[Sequence[str], np.ndarray]],
+        days: int
+    ) -> List[Dict[str, Any]]:
+        """Pick breakfast, lunch and dinner recipe ids for each day from per-category embeddings"""
+        try:
+            categories = list(dict.fromkeys(MEAL_CATEGORIES.values()))
+            orders: Dict[str, List[str]] = {category: [] for category in categories}
+            
+            # Encode preferences per category, then score each against its own candidates only
+            pref_embeddings = self.embedding_model.generate_embeddings([
+                self.preference_text({**user_preferences, "category": category})
+                for category in categories
+            ])
+            for row, category in enumerate(categories):
+                recipe_ids, embeddings = candidates.get(category, ((), None))
+                if len(recipe_ids):
+                    ranked = np.argsort(-(embeddings @ pref_embeddings[row]))
+                    orders[category] = [recipe_ids[i] for i in ranked]
+            
+            # Walk each ranking in order so meals don't repeat until it is exhausted
+            positions = dict.fromkeys(categories, 0)
+            meal_plan = []
+            for day in range(days):
+                meals: Dict[str, Any] = {"day": day + 1}
+                for meal, category in MEAL_CATEGORIES.items():
+                    order = orders[category]
+                    if order:
+                        meals[meal] = order[positions[category] % len(order)]
+                        positions[category] += 1
+                    else:
+                        meals[meal] = None
+                meal_plan.append(meals)
+            
+            return meal_plan
+            
+        except Exception as e:
+            raise RecipeMLError(f"Failed to plan meals: {str(e)}")
+            
     def recommend_recipes(
         self,
         user_preferences: Dict[str, Any],
@@ -177,24 +320,20 @@ class RecipeRecommender:
         """Recommend recipes based on user preferences"""
         try:
             # Convert preferences to embedding
-            pref_text = " ".join([
-                str(value) for value in user_preferences.values()
-                if isinstance(value, (str, int, float))
-            ])
+            pref_text = self.preference_text(user_preferences)
             pref_embedding = self.embedding_model.generate_embedding(pref_text)
             
-            # Get embeddings for all recipes
-            recipe_embeddings = {
-                recipe.id: self.embedding_model.generate_embedding(
-                    self.embedding_model.get_recipe_text(recipe)
-                )
+            # Get embeddings for all recipes in batches
+            embeddings = self.embedding_model.generate_embeddings([
+                self.embedding_model.get_recipe_text(recipe)
                 for recipe in available_recipes
-            }
+            ])
             
             # Find similar recipes
             similar_recipes = self.find_similar_recipes(
                 pref_embedding,
-                recipe_embeddings,
+                [recipe.id for recipe in available_recipes],
+                embeddings,
                 top_k=top_k
             )
             
@@ -209,6 +348,13 @@ class RecipeRecommender:
         except Exception as e:
             raise RecipeMLError(f"Failed to recommend recipes: {str(e)}")
 
+# Ingredient words that trigger meat and vegetable tips, including plurals
+MEAT_WORDS = frozenset({"chicken", "beef", "pork", "fish"})
+VEGETABLE_WORDS = frozenset({
+    "carrot", "carrots", "broccoli", "spinach", "mushroom", "mushrooms"
+})
+_WORD = re.compile(r"[a-z]+")
+
 class RecipeTipGenerator:
     def __init__(self):
         self.cooking_tips = {
@@ -248,40 +394,39 @@ class RecipeTipGenerator:
             tips = []
             
             # Add general tips
-            tips.extend(np.random.choice(
+            tips.extend(_rng.sample(
                 self.cooking_tips["general"],
-                size=min(2, len(self.cooking_tips["general"])),
-                replace=False
+                k=min(2, len(self.cooking_tips["general"]))
             ))
             
             # Add category-specific tips
             if recipe.category.lower() == "dessert":
-                tips.extend(np.random.choice(
+                tips.extend(_rng.sample(
                     self.cooking_tips["baking"],
-                    size=min(2, len(self.cooking_tips["baking"])),
-                    replace=False
+                    k=min(2, len(self.cooking_tips["baking"]))
                 ))
                 
             # Add ingredient-specific tips
-            ingredient_names = [ing.name.lower() for ing in recipe.ingredients]
-            if any(meat in " ".join(ingredient_names) for meat in ["chicken", "beef", "pork", "fish"]):
-                tips.extend(np.random.choice(
+            words = {
+                word for ing in recipe.ingredients
+                for word in _WORD.findall(ing.name.lower())
+            }
+            if not words.isdisjoint(MEAT_WORDS):
+                tips.extend(_rng.sample(
                     self.cooking_tips["meat"],
-                    size=min(2, len(self.cooking_tips["meat"])),
-                    replace=False
+                    k=min(2, len(self.cooking_tips["meat"]))
                 ))
                 
-            if any(veg in " ".join(ingredient_names) for veg in ["carrot", "broccoli", "spinach", "mushroom"]):
-                tips.extend(np.random.choice(
+            if not words.isdisjoint(VEGETABLE_WORDS):
+                tips.extend(_rng.sample(
                     self.cooking_tips["vegetables"],
-                    size=min(2, len(self.cooking_tips["vegetables"])),
-                    replace=False
+                    k=min(2, len(self.cooking_tips["vegetables"]))
                 ))
                 
             # Add recipe-specific tips
-            tips.append(f"For best results, use fresh {np.random.choice([ing.name for ing in recipe.ingredients])}")
+            tips.append(f"For best results, use fresh {_rng.choice([ing.name for ing in recipe.ingredients])}")
             
-            return list(set(tips))  # Remove duplicates
+            return list(dict.fromkeys(tips))  # Remove duplicates, keeping order
             
         except Exception as e:
             raise RecipeMLError(f"Failed to generate cooking tips: {str(e)}")
@@ -293,7 +438,7 @@ class MLManager:
         self.recommender = RecipeRecommender(self.embedding_model)
         self.tip_generator = RecipeTipGenerator()
         
-    def generate_recipe_embedding(self, recipe: RecipeModel) -> List[float]:
+    def generate_recipe_embedding(self, recipe: RecipeModel) -> np.ndarray:
         """Generate embedding for a recipe"""
         text = self.embedding_model.get_recipe_text(recipe)
         return self.embedding_model.generate_embedding(text)
@@ -304,11 +449,12 @@ class MLManager:
         
     def find_similar_recipes(
         self,
-        query_embedding: List[float],
-        recipe_embeddings: Dict[str, List[float]]
+        query_embedding: np.ndarray,
+        recipe_ids: Sequence[str],
+        embeddings: np.ndarray
     ) -> List[tuple[str, float]]:
         """Find similar recipes"""
-        return self.recommender.find_similar_recipes(query_embedding, recipe_embeddings)
+        return self.recommender.find_similar_recipes(query_embedding, recipe_ids, embeddings)
         
     def recommend_recipes(
         self,
@@ -318,6 +464,15 @@ class MLManager:
         """Recommend recipes based on preferences"""
         return self.recommender.recommend_recipes(user_preferences, available_recipes)
         
+    def plan_meals(
+        self,
+        user_preferences: Dict[str, Any],
+        candidates: Dict[str, Tuple[Sequence[str], np.ndarray]],
+        days: int
+    ) -> List[Dict[str, Any]]:
+        """Plan breakfast, lunch and dinner recipe ids for each day"""
+        return self.recommender.plan_meals(user_preferences, candidates, days)
+        
     def generate_recipe_tips(self, recipe: RecipeModel) -> List[str]:
         """Generate cooking tips for a recipe"""
         return self.tip_generator.generate_tips(recipe) 
\ No newline at end of file
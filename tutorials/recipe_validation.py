@@ -1,6 +1,7 @@
-from typing import Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
-from datetime import datetime
+from typing import Annotated, Dict, Any, List, NotRequired, TypedDict
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
+from datetime import datetime, timezone
+from functools import partial
 from enum import Enum
 from recipe_exceptions import RecipeValidationError
 
@@ -17,129 +18,235 @@ class RecipeDifficulty(str, Enum):
     MEDIUM = "medium"
     HARD = "hard"
 
+# Timezone-aware UTC now; shared with recipe_db so stored and validated timestamps agree
+utc_now = partial(datetime.now, timezone.utc)
+
+def _enum_lookup(enum_cls: type[Enum], label: str):
+    """Build a validator resolving enum values with one dict lookup."""
+    members = enum_cls._value2member_map_
+    valid = ", ".join(members)
+
+    def lookup(v: Any) -> Enum:
+        # str-valued members hash like their values, so members pass straight through
+        member = members.get(v) if isinstance(v, str) else None
+        if member is None:
+            raise RecipeValidationError(f"Invalid {label}: {v}. Valid options are: {valid}")
+        return member
+
+    return lookup
+
+_to_category = _enum_lookup(RecipeCategory, "category")
+_to_difficulty = _enum_lookup(RecipeDifficulty, "difficulty")
+
+Category = Annotated[RecipeCategory, BeforeValidator(_to_category)]
+Difficulty = Annotated[RecipeDifficulty, BeforeValidator(_to_difficulty)]
+
+_VALID_UNITS = frozenset({
+    "g", "kg", "oz", "lb", "ml", "l", "cup", "tbsp", "tsp",
+    "piece", "whole", "pinch", "dash"
+})
+_VALID_UNITS_STR = ", ".join(sorted(_VALID_UNITS))
+
+_VALID_RESTRICTIONS = frozenset({
+    "vegetarian", "vegan", "gluten-free", "dairy-free",
+    "nut-free", "low-carb", "keto", "paleo"
+})
+_VALID_RESTRICTIONS_STR = ", ".join(sorted(_VALID_RESTRICTIONS))
+
+_REQUIRED_NUTRITION = frozenset({"calories", "protein", "carbs", "fat"})
+_REQUIRED_NUTRITION_STR = ", ".join(sorted(_REQUIRED_NUTRITION))
+
+def _check_nutrition(v: Dict[str, float]) -> Dict[str, float]:
+    """Require the core nutrition keys."""
+    if not _REQUIRED_NUTRITION <= v.keys():
+        raise RecipeValidationError(
+            f"Nutrition info must include: {_REQUIRED_NUTRITION_STR}"
+        )
+    return v
+
+NutritionInfo = Annotated[Dict[str, float], AfterValidator(_check_nutrition)]
+
+_REQUIRED_SEARCH = frozenset({"query", "page", "per_page"})
+
 class IngredientModel(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     name: str = Field(..., min_length=1, max_length=100)
     amount: float = Field(..., gt=0)
     unit: str = Field(..., min_length=1, max_length=20)
     notes: str | None = Field(None, max_length=500)
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not v.strip():
-            raise RecipeValidationError("Ingredient name cannot be empty")
-        return v.strip()
-
     @field_validator("unit")
     @classmethod
     def validate_unit(cls, v: str) -> str:
-        valid_units = {
-            "g", "kg", "oz", "lb", "ml", "l", "cup", "tbsp", "tsp", 
-            "piece", "whole", "pinch", "dash"
-        }
-        if v.lower() not in valid_units:
+        unit = v.lower()
+        if unit not in _VALID_UNITS:
             raise RecipeValidationError(
-                f"Invalid unit: {v}. Valid units are: {', '.join(valid_units)}"
+                f"Invalid unit: {v}. Valid units are: {_VALID_UNITS_STR}"
             )
-        return v.lower()
+        return unit
 
 class RecipeModel(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     id: str | None = None
     name: str = Field(..., min_length=1, max_length=200)
     description: str = Field(..., min_length=10, max_length=2000)
     ingredients: List[IngredientModel] = Field(..., min_length=1)
     instructions: List[str] = Field(..., min_length=1)
-    category: RecipeCategory
-    difficulty: RecipeDifficulty
+    category: Category
+    difficulty: Difficulty
     prep_time: int = Field(..., ge=0)
     cook_time: int = Field(..., ge=0)
     servings: int = Field(..., gt=0)
     tags: List[str] = Field(default_factory=list)
-    nutrition_info: Dict[str, float] | None = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    nutrition_info: NutritionInfo | None = None
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     @field_validator("instructions")
     @classmethod
     def validate_instructions(cls, v: List[str]) -> List[str]:
-        if not all(step.strip() for step in v):
+        if not all(v):
             raise RecipeValidationError("Instructions cannot contain empty steps")
-        return [step.strip() for step in v]
+        return v
 
     @field_validator("tags")
     @classmethod
     def validate_tags(cls, v: List[str]) -> List[str]:
-        return [tag.lower().strip() for tag in v if tag.strip()]
+        # Tags arrive already stripped by str_strip_whitespace
+        return [tag.lower() for tag in v if tag]
 
-    @field_validator("nutrition_info")
     @classmethod
-    def validate_nutrition_info(cls, v: Dict[str, float] | None) -> Dict[str, float] | None:
-        if v is None:
-            return None
-        required_fields = {"calories", "protein", "carbs", "fat"}
-        if not all(field in v for field in required_fields):
-            raise RecipeValidationError(
-                f"Nutrition info must include: {', '.join(required_fields)}"
-            )
-        return v
+    def construct_trusted(cls, data: Dict[str, Any]) -> "RecipeModel":
+        """Build a recipe from already-validated data, skipping validation."""
+        return cls.model_construct(**{
+            **data,
+            "ingredients": [
+                IngredientModel.model_construct(**ing) for ing in data["ingredients"]
+            ],
+            "category": _to_category(data["category"]),
+            "difficulty": _to_difficulty(data["difficulty"])
+        })
 
 class MealPlanPreferences(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     days: int = Field(..., gt=0, le=31)
     dietary_restrictions: List[str] = Field(default_factory=list)
     excluded_ingredients: List[str] = Field(default_factory=list)
     calories_per_day: int | None = Field(None, gt=0)
     max_prep_time: int | None = Field(None, ge=0)
-    difficulty: RecipeDifficulty | None = None
+    difficulty: Difficulty | None = None
 
     @field_validator("dietary_restrictions")
     @classmethod
     def validate_dietary_restrictions(cls, v: List[str]) -> List[str]:
-        valid_restrictions = {
-            "vegetarian", "vegan", "gluten-free", "dairy-free", 
-            "nut-free", "low-carb", "keto", "paleo"
-        }
-        invalid = [r for r in v if r.lower() not in valid_restrictions]
+        restrictions, invalid = [], []
+        for r in v:
+            lowered = r.lower()
+            if lowered in _VALID_RESTRICTIONS:
+                restrictions.append(lowered)
+            else:
+                invalid.append(r)
         if invalid:
             raise RecipeValidationError(
                 f"Invalid dietary restrictions: {', '.join(invalid)}. "
-                f"Valid options are: {', '.join(valid_restrictions)}"
+                f"Valid options are: {_VALID_RESTRICTIONS_STR}"
             )
-        return [r.lower() for r in v]
+        return restrictions
+
+def _fmt_errors(error: ValidationError) -> str:
+    """Summarize validation errors as 'field.path: message' entries."""
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in error.errors(include_url=False)
+    )
 
-def validate_recipe_data(data: Dict[str, Any]) -> RecipeModel:
-    """Validate recipe data using the RecipeModel."""
+def validate_recipe_data(data: Dict[str, Any], trusted: bool = False) -> RecipeModel:
+    """Validate recipe data using the RecipeModel.
+    
+    Pass trusted=True for data that came from our own storage to skip validation.
+    """
+    if trusted:
+        return RecipeModel.construct_trusted(data)
+    try:
+        return RecipeModel.model_validate(data)
+    except ValidationError as e:
+        raise RecipeValidationError(_fmt_errors(e)) from e
+
+def decode_recipe_json(raw: bytes | str) -> RecipeModel:
+    """Parse and validate a JSON recipe in one pass, without an intermediate dict."""
     try:
-        return RecipeModel(**data)
-    except Exception as e:
-        raise RecipeValidationError(str(e))
-
-def validate_search_query(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate search query parameters."""
-    required = {"query", "page", "per_page"}
-    if not all(key in data for key in required):
-        raise RecipeValidationError(f"Missing required fields: {required - data.keys()}")
+        return RecipeModel.model_validate_json(raw)
+    except ValidationError as e:
+        raise RecipeValidationError(_fmt_errors(e)) from e
+
+_RECIPE_LIST = TypeAdapter(List[RecipeModel])
+
+def validate_recipe_batch(data: bytes | str | List[Dict[str, Any]]) -> List[RecipeModel]:
+    """Validate a list of recipes, or a JSON array of them, in one validator call."""
+    try:
+        if isinstance(data, (bytes, str)):
+            return _RECIPE_LIST.validate_json(data)
+        return _RECIPE_LIST.validate_python(data)
+    except ValidationError as e:
+        raise RecipeValidationError(_fmt_errors(e)) from e
+
+class SearchQueryIn(TypedDict):
+    """Search request as received from callers."""
+    query: str
+    page: int | str
+    per_page: int | str
+    filters: NotRequired[Dict[str, Any]]
+
+class SearchQuery(TypedDict):
+    """Normalized search parameters."""
+    query: str
+    page: int
+    per_page: int
+    filters: Dict[str, Any]
+
+def _pos_int(value: Any) -> int | None:
+    """Parse a positive int from an int or a digit string, or return None."""
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        value = int(value)
+    return int(value) if isinstance(value, int) and value >= 1 else None
+
+def validate_search_query(data: SearchQueryIn) -> SearchQuery:
+    """Validate search query parameters from an untrusted caller."""
+    missing = _REQUIRED_SEARCH - data.keys()
+    if missing:
+        raise RecipeValidationError(f"Missing required fields: {missing}")
     
     if not isinstance(data["query"], str):
         raise RecipeValidationError("Query must be a string")
     
-    try:
-        page = int(data["page"])
-        per_page = int(data["per_page"])
-        if page < 1 or per_page < 1:
-            raise ValueError
-    except (ValueError, TypeError):
+    page = _pos_int(data["page"])
+    per_page = _pos_int(data["per_page"])
+    if page is None or per_page is None:
         raise RecipeValidationError("Page and per_page must be positive integers")
     
+    # Shape is checked; normalize through the trusted path
+    return validate_search_query_trusted(data["query"], page, per_page, data.get("filters"))
+
+def validate_search_query_trusted(
+    query: str,
+    page: int = 1,
+    per_page: int = 10,
+    filters: Dict[str, Any] | None = None
+) -> SearchQuery:
+    """Build search parameters from typed internal arguments, skipping shape checks."""
     return {
-        "query": data["query"].strip(),
+        "query": query.strip(),
         "page": page,
         "per_page": per_page,
-        "filters": data.get("filters", {})
+        "filters": filters or {}
     }
 
 def validate_meal_plan_preferences(data: Dict[str, Any]) -> MealPlanPreferences:
     """Validate meal plan preferences using the MealPlanPreferences model."""
     try:
-        return MealPlanPreferences(**data)
-    except Exception as e:
-        raise RecipeValidationError(str(e)) 
\ No newline at end of file
+        return MealPlanPreferences.model_validate(data)
+    except ValidationError as e:
+        raise RecipeValidationError(_fmt_errors(e)) from e 
\ No newline at end of file
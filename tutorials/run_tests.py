@@ -1,19 +1,34 @@
 import os
 import asyncio
 from pathlib import Path
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
 
-from src.lib.test_framework import TestFramework
-from src.lib.smol_loop import SmolLoopConfig
-from src.lib.improver import SmolImprover, ImprovementStrategy
+# Absolute paths of directories already created by this process
+_ensured_dirs: set[Path] = set()
 
-# Configure console
-console = Console()
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per process and return its absolute path"""
+    # Resolve first so a later chdir can't make a relative path look already created
+    path = path.resolve()
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+NUM_ITERATIONS = 100
 
 async def main():
+    # Heavy imports are deferred so loading this module stays cheap
+    from dotenv import load_dotenv
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
+    from src.lib.test_framework import TestFramework
+    from src.lib.smol_loop import SmolLoopConfig
+    from src.lib.improver import SmolImprover, ImprovementStrategy
+    
+    # Configure console
+    console = Console()
+    
     load_dotenv()
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
     together_key = os.getenv("TOGETHER_AI_API_KEY")
@@ -27,8 +42,7 @@ async def main():
         return
     
     # Create output directory
-    output_dir = Path("output") / "latest"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = ensure_dir(Path("output") / "latest")
     
     # Configure framework
     config = SmolLoopConfig(
@@ -69,11 +83,11 @@ async def main():
         TimeElapsedColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("[cyan]Running tests...", total=100)
+        task = progress.add_task("[cyan]Running tests...", total=NUM_ITERATIONS)
         
         try:
-            await framework.run_tests(num_iterations=100)
-            progress.update(task, completed=100)
+            await framework.run_tests(num_iterations=NUM_ITERATIONS)
+            progress.update(task, completed=NUM_ITERATIONS)
         except Exception as e:
             console.print(f"\n[red]Error: {e}[/red]")
             return